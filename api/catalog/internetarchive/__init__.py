@@ -1,23 +1,48 @@
-from .client import (
-    AssetBundle,
-    AssetPlan,
-    DownloadOptions,
-    InternetArchiveClient,
-    InternetArchiveDownloadError,
-    MediaTypeConfig,
-)
-from .movie import (
-    MovieAssetBundle,
-    MovieAssetPlan,
-    MovieCatalogClient,
-    MovieDownloadOptions,
-)
-from .tv import (
-    TvAssetBundle,
-    TvAssetPlan,
-    TvCatalogClient,
-    TvDownloadOptions,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import (
+        AssetBundle,
+        AssetPlan,
+        DownloadOptions,
+        InternetArchiveClient,
+        InternetArchiveDownloadError,
+        MediaTypeConfig,
+    )
+    from .movie import (
+        MovieAssetBundle,
+        MovieAssetPlan,
+        MovieCatalogClient,
+        MovieDownloadOptions,
+    )
+    from .tv import (
+        TvAssetBundle,
+        TvAssetPlan,
+        TvCatalogClient,
+        TvDownloadOptions,
+    )
+
+# Callers import ``.movie`` or ``.tv`` directly; resolve the package-level names
+# on first access so importing one media type does not load the other.
+_EXPORTS = {
+    "AssetBundle": ".client",
+    "AssetPlan": ".client",
+    "DownloadOptions": ".client",
+    "InternetArchiveClient": ".client",
+    "InternetArchiveDownloadError": ".client",
+    "MediaTypeConfig": ".client",
+    "MovieCatalogClient": ".movie",
+    "MovieAssetBundle": ".movie",
+    "MovieAssetPlan": ".movie",
+    "MovieDownloadOptions": ".movie",
+    "TvCatalogClient": ".tv",
+    "TvAssetBundle": ".tv",
+    "TvAssetPlan": ".tv",
+    "TvDownloadOptions": ".tv",
+}
 
 __all__ = [
     "AssetBundle",
@@ -36,3 +61,16 @@ __all__ = [
     "TvDownloadOptions",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
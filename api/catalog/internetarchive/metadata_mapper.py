@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import html
 import re
+import sys
 from datetime import datetime
 from typing import Any, Iterable, Mapping, Optional
 
@@ -47,7 +48,8 @@ def _parse_languages(raw: Any) -> list[str] | None:
         langs = [str(item).strip() for item in raw if item]
     else:
         langs = [segment.strip() for segment in re.split(r"[,;/]", str(raw)) if segment.strip()]
-    return langs or None
+    # Language codes repeat across every item; share one string object per code.
+    return [sys.intern(lang) for lang in langs] or None
 
 
 def _parse_subjects(raw: Any) -> list[str] | None:
@@ -57,7 +59,7 @@ def _parse_subjects(raw: Any) -> list[str] | None:
         subjects = [str(item).strip() for item in raw if item]
     else:
         subjects = [str(raw).strip()]
-    return subjects or None
+    return [sys.intern(subject) for subject in subjects] or None
 
 
 def _parse_year(*values: Any) -> int | None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Sequence
@@ -10,6 +11,7 @@ import httpx
 from dotenv import load_dotenv
 
 from domain.media.music import MusicTrackMedia
+from utils.serialization import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,25 @@ load_dotenv()
 
 JAMENDO_BASE_URL = "https://api.jamendo.com/v3.0"
 
+_DIGITS = {ch: value for value, ch in enumerate("0123456789")}
+
+
+def _fast_year(value: str | None) -> int | None:
+    """Return the year of a ``YYYY[-MM[-DD]]`` string without calling ``int``."""
+
+    if not value or len(value) < 4 or (len(value) > 4 and value[4] != "-"):
+        return None
+    digits = _DIGITS
+    try:
+        return (
+            digits[value[0]] * 1000
+            + digits[value[1]] * 100
+            + digits[value[2]] * 10
+            + digits[value[3]]
+        )
+    except KeyError:
+        return None
+
 
 class JamendoAPIError(RuntimeError):
     """Generic Jamendo API error."""
@@ -198,7 +219,7 @@ class JamendoClient:
 
     def _parse_response(self, response: httpx.Response) -> dict[str, Any]:
         try:
-            payload = response.json()
+            payload = json_loads(response.content)
         except ValueError as exc:  # pragma: no cover - defensive guard
             snippet = response.text[:200] if response.text else "<empty>"
             raise JamendoAPIError(
@@ -216,14 +237,19 @@ class JamendoClient:
     def _ensure_list(values: Any) -> list[str] | None:
         if not values:
             return None
+        # Genre tags come from a small vocabulary; intern so tracks share them.
         if isinstance(values, list):
-            return [str(v) for v in values if v]
-        return [str(values)]
+            return [sys.intern(str(v)) for v in values if v]
+        return [sys.intern(str(values))]
 
     @staticmethod
     def _parse_year(value: Any) -> int | None:
         if not value:
             return None
+        if isinstance(value, str):
+            year = _fast_year(value)
+            if year is not None:
+                return year
         try:
             text = str(value)
             for token in text.split("-"):
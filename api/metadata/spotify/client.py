@@ -14,6 +14,8 @@ from typing import Any, Optional
 
 import httpx
 
+from utils.serialization import json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +36,20 @@ class SpotifyArtist:
     followers: Optional[int] = None
     images: Optional[list[dict[str, Any]]] = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpotifyArtist:
+        """Build from a Spotify API payload."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            uri=data["uri"],
+            external_urls=data["external_urls"],
+            genres=data.get("genres", []),
+            popularity=data.get("popularity"),
+            followers=data.get("followers", {}).get("total"),
+            images=data.get("images"),
+        )
+
 
 @dataclass(slots=True, frozen=True)
 class SpotifyAlbum:
@@ -54,6 +70,26 @@ class SpotifyAlbum:
     popularity: Optional[int] = None
     copyrights: Optional[list[dict[str, str]]] = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpotifyAlbum:
+        """Build from a Spotify API payload."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            uri=data["uri"],
+            album_type=data["album_type"],
+            release_date=data["release_date"],
+            release_date_precision=data["release_date_precision"],
+            total_tracks=data["total_tracks"],
+            external_urls=data["external_urls"],
+            images=data["images"],
+            artists=data["artists"],
+            genres=data.get("genres"),
+            label=data.get("label"),
+            popularity=data.get("popularity"),
+            copyrights=data.get("copyrights"),
+        )
+
 
 @dataclass(slots=True, frozen=True)
 class SpotifyTrack:
@@ -76,6 +112,28 @@ class SpotifyTrack:
     is_local: bool
     raw_data: dict[str, Any]  # Store complete response
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpotifyTrack:
+        """Build from a Spotify API payload."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            uri=data["uri"],
+            duration_ms=data["duration_ms"],
+            explicit=data["explicit"],
+            external_urls=data["external_urls"],
+            external_ids=data.get("external_ids", {}),
+            preview_url=data.get("preview_url"),
+            track_number=data["track_number"],
+            disc_number=data["disc_number"],
+            popularity=data["popularity"],
+            artists=data["artists"],
+            album=data["album"],
+            available_markets=data.get("available_markets", []),
+            is_local=data.get("is_local", False),
+            raw_data=data,
+        )
+
 
 @dataclass(slots=True, frozen=True)
 class SpotifyAudioFeatures:
@@ -96,6 +154,26 @@ class SpotifyAudioFeatures:
     valence: float  # 0.0 to 1.0 (musical positiveness)
     duration_ms: int
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpotifyAudioFeatures:
+        """Build from a Spotify API payload."""
+        return cls(
+            id=data["id"],
+            acousticness=data["acousticness"],
+            danceability=data["danceability"],
+            energy=data["energy"],
+            instrumentalness=data["instrumentalness"],
+            key=data["key"],
+            liveness=data["liveness"],
+            loudness=data["loudness"],
+            mode=data["mode"],
+            speechiness=data["speechiness"],
+            tempo=data["tempo"],
+            time_signature=data["time_signature"],
+            valence=data["valence"],
+            duration_ms=data["duration_ms"],
+        )
+
 
 # ============================================================================
 # Podcast Data Classes
@@ -121,6 +199,27 @@ class SpotifyShow:
     is_externally_hosted: Optional[bool] = None
     raw_data: dict[str, Any] = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpotifyShow:
+        """Build from a Spotify API payload."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            uri=data["uri"],
+            description=data["description"],
+            publisher=data["publisher"],
+            external_urls=data["external_urls"],
+            images=data["images"],
+            languages=data["languages"],
+            media_type=data["media_type"],
+            explicit=data["explicit"],
+            total_episodes=data["total_episodes"],
+            copyrights=data.get("copyrights"),
+            html_description=data.get("html_description"),
+            is_externally_hosted=data.get("is_externally_hosted"),
+            raw_data=data,
+        )
+
 
 @dataclass(slots=True, frozen=True)
 class SpotifyEpisode:
@@ -143,6 +242,28 @@ class SpotifyEpisode:
     is_externally_hosted: Optional[bool] = None
     raw_data: dict[str, Any] = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpotifyEpisode:
+        """Build from a Spotify API payload."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            uri=data["uri"],
+            description=data["description"],
+            duration_ms=data["duration_ms"],
+            explicit=data["explicit"],
+            external_urls=data["external_urls"],
+            images=data["images"],
+            release_date=data["release_date"],
+            release_date_precision=data["release_date_precision"],
+            languages=data["languages"],
+            audio_preview_url=data.get("audio_preview_url"),
+            html_description=data.get("html_description"),
+            show=data["show"],
+            is_externally_hosted=data.get("is_externally_hosted"),
+            raw_data=data,
+        )
+
 
 # ============================================================================
 # Search Result Data Classes
@@ -233,7 +354,7 @@ class SpotifyClient:
             response = await self._client.post(self.AUTH_URL, headers=headers, data=data)
             response.raise_for_status()
             
-            auth_data = response.json()
+            auth_data = json_loads(response.content)
             self._access_token = auth_data["access_token"]
             expires_in = auth_data["expires_in"]  # seconds
             self._token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
@@ -278,7 +399,8 @@ class SpotifyClient:
                 method, url, headers=headers, params=params
             )
             response.raise_for_status()
-            return response.json()
+            # Parse the raw body bytes directly; skips decoding to ``str`` first.
+            return json_loads(response.content)
         except httpx.HTTPStatusError as e:
             error_data = {}
             try:
@@ -325,24 +447,28 @@ class SpotifyClient:
         
         data = await self._request("GET", "search", params)
         
+        # Bind hot names once; the comprehension below runs per result item.
+        result_cls = SpotifySearchResult
+        get = dict.get
+
         results = {}
         for search_type in types:
             key = f"{search_type}s"
             if key in data:
-                items = data[key].get("items", [])
+                items = get(data[key], "items", [])
                 results[search_type] = [
-                    SpotifySearchResult(
+                    result_cls(
                         type=search_type,
                         id=item["id"],
                         name=item["name"],
                         uri=item["uri"],
-                        external_urls=item.get("external_urls", {}),
-                        artists=item.get("artists"),
-                        album=item.get("album"),
-                        publisher=item.get("publisher"),
-                        description=item.get("description"),
-                        images=item.get("images"),
-                        release_date=item.get("release_date"),
+                        external_urls=get(item, "external_urls", {}),
+                        artists=get(item, "artists"),
+                        album=get(item, "album"),
+                        publisher=get(item, "publisher"),
+                        description=get(item, "description"),
+                        images=get(item, "images"),
+                        release_date=get(item, "release_date"),
                     )
                     for item in items
                 ]
@@ -366,24 +492,7 @@ class SpotifyClient:
         params = {"market": market}
         data = await self._request("GET", f"tracks/{track_id}", params)
         
-        return SpotifyTrack(
-            id=data["id"],
-            name=data["name"],
-            uri=data["uri"],
-            duration_ms=data["duration_ms"],
-            explicit=data["explicit"],
-            external_urls=data["external_urls"],
-            external_ids=data.get("external_ids", {}),
-            preview_url=data.get("preview_url"),
-            track_number=data["track_number"],
-            disc_number=data["disc_number"],
-            popularity=data["popularity"],
-            artists=data["artists"],
-            album=data["album"],
-            available_markets=data.get("available_markets", []),
-            is_local=data.get("is_local", False),
-            raw_data=data,
-        )
+        return SpotifyTrack.from_dict(data)
     
     async def get_audio_features(self, track_id: str) -> SpotifyAudioFeatures:
         """Get audio features for a track.
@@ -396,22 +505,7 @@ class SpotifyClient:
         """
         data = await self._request("GET", f"audio-features/{track_id}")
         
-        return SpotifyAudioFeatures(
-            id=data["id"],
-            acousticness=data["acousticness"],
-            danceability=data["danceability"],
-            energy=data["energy"],
-            instrumentalness=data["instrumentalness"],
-            key=data["key"],
-            liveness=data["liveness"],
-            loudness=data["loudness"],
-            mode=data["mode"],
-            speechiness=data["speechiness"],
-            tempo=data["tempo"],
-            time_signature=data["time_signature"],
-            valence=data["valence"],
-            duration_ms=data["duration_ms"],
-        )
+        return SpotifyAudioFeatures.from_dict(data)
     
     async def get_artist(self, artist_id: str) -> SpotifyArtist:
         """Get detailed information about an artist.
@@ -424,16 +518,7 @@ class SpotifyClient:
         """
         data = await self._request("GET", f"artists/{artist_id}")
         
-        return SpotifyArtist(
-            id=data["id"],
-            name=data["name"],
-            uri=data["uri"],
-            external_urls=data["external_urls"],
-            genres=data.get("genres", []),
-            popularity=data.get("popularity"),
-            followers=data.get("followers", {}).get("total"),
-            images=data.get("images"),
-        )
+        return SpotifyArtist.from_dict(data)
     
     async def get_album(self, album_id: str, *, market: str = "US") -> SpotifyAlbum:
         """Get detailed information about an album.
@@ -448,22 +533,7 @@ class SpotifyClient:
         params = {"market": market}
         data = await self._request("GET", f"albums/{album_id}", params)
         
-        return SpotifyAlbum(
-            id=data["id"],
-            name=data["name"],
-            uri=data["uri"],
-            album_type=data["album_type"],
-            release_date=data["release_date"],
-            release_date_precision=data["release_date_precision"],
-            total_tracks=data["total_tracks"],
-            external_urls=data["external_urls"],
-            images=data["images"],
-            artists=data["artists"],
-            genres=data.get("genres"),
-            label=data.get("label"),
-            popularity=data.get("popularity"),
-            copyrights=data.get("copyrights"),
-        )
+        return SpotifyAlbum.from_dict(data)
     
     # ========================================================================
     # Podcast Methods
@@ -482,23 +552,7 @@ class SpotifyClient:
         params = {"market": market}
         data = await self._request("GET", f"shows/{show_id}", params)
         
-        return SpotifyShow(
-            id=data["id"],
-            name=data["name"],
-            uri=data["uri"],
-            description=data["description"],
-            publisher=data["publisher"],
-            external_urls=data["external_urls"],
-            images=data["images"],
-            languages=data["languages"],
-            media_type=data["media_type"],
-            explicit=data["explicit"],
-            total_episodes=data["total_episodes"],
-            copyrights=data.get("copyrights"),
-            html_description=data.get("html_description"),
-            is_externally_hosted=data.get("is_externally_hosted"),
-            raw_data=data,
-        )
+        return SpotifyShow.from_dict(data)
     
     async def get_episode(self, episode_id: str, *, market: str = "US") -> SpotifyEpisode:
         """Get detailed information about a podcast episode.
@@ -513,24 +567,7 @@ class SpotifyClient:
         params = {"market": market}
         data = await self._request("GET", f"episodes/{episode_id}", params)
         
-        return SpotifyEpisode(
-            id=data["id"],
-            name=data["name"],
-            uri=data["uri"],
-            description=data["description"],
-            duration_ms=data["duration_ms"],
-            explicit=data["explicit"],
-            external_urls=data["external_urls"],
-            images=data["images"],
-            release_date=data["release_date"],
-            release_date_precision=data["release_date_precision"],
-            languages=data["languages"],
-            audio_preview_url=data.get("audio_preview_url"),
-            html_description=data.get("html_description"),
-            show=data["show"],
-            is_externally_hosted=data.get("is_externally_hosted"),
-            raw_data=data,
-        )
+        return SpotifyEpisode.from_dict(data)
     
     # ========================================================================
     # Utility Methods
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional, TYPE_CHECKING
 from dotenv import load_dotenv
 import os
 
@@ -13,146 +16,177 @@ load_dotenv()
 TMDB_API_KEY = os.getenv("TMDB_API_KEY")
 TMDB_ACCESS_TOKEN = os.getenv("TMDB_ACCESS_TOKEN")
 import httpx
+import msgspec
+
+from utils.serialization import json_loads
+
+try:
+    import h2  # noqa: F401
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
 
 logger = logging.getLogger(__name__)
 
+# Endpoint paths, relative to the client's base_url.
+_SEARCH_MOVIE = "search/movie"
+_SEARCH_TV = "search/tv"
+
+
+def _intern_all(values: Iterable[str]) -> list[str]:
+    """Intern low-cardinality labels (languages, genres) shared across results."""
+    return [sys.intern(value) for value in values if value]
+
+
 if TYPE_CHECKING:
     from domain.media.movies import MovieMedia
 
 
-@dataclass(slots=True, frozen=True)
-class TMDbSearchResult:
+class TMDbSearchResult(msgspec.Struct, frozen=True, gc=False):
     """Represents a movie search result from TMDb."""
 
     id: int
-    title: str
-    original_title: str
-    release_date: Optional[str]
-    overview: Optional[str]
-    poster_path: Optional[str]
-    backdrop_path: Optional[str]
-    popularity: float
-    vote_average: float
-    vote_count: int
-    adult: bool
-    original_language: str
-    genre_ids: list[int]
-
-
-@dataclass(slots=True, frozen=True)
-class TMDbTvSearchResult:
+    title: Optional[str] = ""
+    original_title: Optional[str] = ""
+    release_date: Optional[str] = None
+    overview: Optional[str] = None
+    poster_path: Optional[str] = None
+    backdrop_path: Optional[str] = None
+    popularity: Optional[float] = 0.0
+    vote_average: Optional[float] = 0.0
+    vote_count: Optional[int] = 0
+    adult: Optional[bool] = False
+    original_language: Optional[str] = ""
+    genre_ids: list[int] = []
+
+
+class TMDbTvSearchResult(msgspec.Struct, frozen=True, gc=False):
     """Represents a TV show search result from TMDb."""
 
     id: int
-    name: str
-    original_name: str
-    first_air_date: Optional[str]
-    overview: Optional[str]
-    poster_path: Optional[str]
-    backdrop_path: Optional[str]
-    popularity: float
-    vote_average: float
-    vote_count: int
-    origin_country: list[str]
-    original_language: str
-    genre_ids: list[int]
-
-
-@dataclass(slots=True, frozen=True)
-class TMDbGenre:
+    name: Optional[str] = ""
+    original_name: Optional[str] = ""
+    first_air_date: Optional[str] = None
+    overview: Optional[str] = None
+    poster_path: Optional[str] = None
+    backdrop_path: Optional[str] = None
+    popularity: Optional[float] = 0.0
+    vote_average: Optional[float] = 0.0
+    vote_count: Optional[int] = 0
+    origin_country: list[str] = []
+    original_language: Optional[str] = ""
+    genre_ids: list[int] = []
+
+
+class TMDbGenre(msgspec.Struct, frozen=True, gc=False):
     """Represents a movie genre."""
 
     id: int
-    name: str
+    name: Optional[str] = None
 
 
-@dataclass(slots=True, frozen=True)
-class TMDbProductionCompany:
+class TMDbProductionCompany(msgspec.Struct, frozen=True, gc=False):
     """Represents a production company."""
 
     id: int
-    name: str
-    logo_path: Optional[str]
-    origin_country: str
+    name: Optional[str] = None
+    logo_path: Optional[str] = None
+    origin_country: Optional[str] = ""
 
 
-@dataclass(slots=True, frozen=True)
-class TMDbProductionCountry:
+class TMDbProductionCountry(msgspec.Struct, frozen=True, gc=False):
     """Represents a production country."""
 
-    iso_3166_1: str
-    name: str
+    iso_3166_1: Optional[str] = None
+    name: Optional[str] = None
 
 
-@dataclass(slots=True, frozen=True)
-class TMDbSpokenLanguage:
+class TMDbSpokenLanguage(msgspec.Struct, frozen=True, gc=False):
     """Represents a spoken language."""
 
-    iso_639_1: str
-    name: str
-    english_name: str
+    iso_639_1: Optional[str] = None
+    name: Optional[str] = None
+    english_name: Optional[str] = ""
+
+
+class TMDbCastMember(msgspec.Struct, frozen=True, gc=False):
+    name: Optional[str] = ""
+
+
+class TMDbCredits(msgspec.Struct, frozen=True, gc=False):
+    """The ``credits`` block returned with ``append_to_response=credits``."""
 
+    cast: list[TMDbCastMember] = []
 
-@dataclass(slots=True, frozen=True)
-class TMDbMovie:
+
+class TMDbMovie(msgspec.Struct, frozen=True, gc=False):
     """Represents detailed movie information from TMDb."""
 
     id: int
-    title: str
-    original_title: str
-    tagline: Optional[str]
-    overview: Optional[str]
-    release_date: Optional[str]
-    runtime: Optional[int]  # in minutes
-    status: str
-    budget: int
-    revenue: int
-    homepage: Optional[str]
-    imdb_id: Optional[str]
-    poster_path: Optional[str]
-    backdrop_path: Optional[str]
-    popularity: float
-    vote_average: float
-    vote_count: int
-    adult: bool
-    original_language: str
-    genres: list[TMDbGenre]
-    production_companies: list[TMDbProductionCompany]
-    production_countries: list[TMDbProductionCountry]
-    spoken_languages: list[TMDbSpokenLanguage]
-    raw_data: dict[str, Any]  # Store the complete raw response
-
-
-@dataclass(slots=True, frozen=True)
-class TMDbTvShow:
+    title: Optional[str] = ""
+    original_title: Optional[str] = ""
+    tagline: Optional[str] = None
+    overview: Optional[str] = None
+    release_date: Optional[str] = None
+    runtime: Optional[int] = None  # in minutes
+    status: Optional[str] = ""
+    budget: Optional[int] = 0
+    revenue: Optional[int] = 0
+    homepage: Optional[str] = None
+    imdb_id: Optional[str] = None
+    poster_path: Optional[str] = None
+    backdrop_path: Optional[str] = None
+    popularity: Optional[float] = 0.0
+    vote_average: Optional[float] = 0.0
+    vote_count: Optional[int] = 0
+    adult: Optional[bool] = False
+    original_language: Optional[str] = ""
+    genres: list[TMDbGenre] = []
+    production_companies: list[TMDbProductionCompany] = []
+    production_countries: list[TMDbProductionCountry] = []
+    spoken_languages: list[TMDbSpokenLanguage] = []
+    credits: Optional[TMDbCredits] = None
+
+
+class TMDbTvShow(msgspec.Struct, frozen=True, gc=False):
     """Represents detailed TV show information from TMDb."""
 
     id: int
-    name: str
-    original_name: str
-    tagline: Optional[str]
-    overview: Optional[str]
-    first_air_date: Optional[str]
-    last_air_date: Optional[str]
-    status: str
-    type: str  # Scripted, Reality, etc.
-    number_of_seasons: int
-    number_of_episodes: int
-    homepage: Optional[str]
-    poster_path: Optional[str]
-    backdrop_path: Optional[str]
-    popularity: float
-    vote_average: float
-    vote_count: int
-    original_language: str
-    origin_country: list[str]
-    genres: list[TMDbGenre]
-    production_companies: list[TMDbProductionCompany]
-    production_countries: list[TMDbProductionCountry]
-    spoken_languages: list[TMDbSpokenLanguage]
-    networks: list[dict[str, Any]]  # Network information
-    created_by: list[dict[str, Any]]  # Creator information
-    raw_data: dict[str, Any]  # Store the complete raw response
+    name: Optional[str] = ""
+    original_name: Optional[str] = ""
+    tagline: Optional[str] = None
+    overview: Optional[str] = None
+    first_air_date: Optional[str] = None
+    last_air_date: Optional[str] = None
+    status: Optional[str] = ""
+    type: Optional[str] = ""  # Scripted, Reality, etc.
+    number_of_seasons: Optional[int] = 0
+    number_of_episodes: Optional[int] = 0
+    homepage: Optional[str] = None
+    poster_path: Optional[str] = None
+    backdrop_path: Optional[str] = None
+    popularity: Optional[float] = 0.0
+    vote_average: Optional[float] = 0.0
+    vote_count: Optional[int] = 0
+    original_language: Optional[str] = ""
+    origin_country: list[str] = []
+    genres: list[TMDbGenre] = []
+    production_companies: list[TMDbProductionCompany] = []
+    production_countries: list[TMDbProductionCountry] = []
+    spoken_languages: list[TMDbSpokenLanguage] = []
+    networks: list[dict[str, Any]] = []  # Network information
+    created_by: list[dict[str, Any]] = []  # Creator information
+    credits: Optional[TMDbCredits] = None
+
+
+class _MovieSearchResponse(msgspec.Struct, gc=False):
+    results: list[TMDbSearchResult] = []
+    total_pages: Optional[int] = 1
+
+
+class _TvSearchResponse(msgspec.Struct, gc=False):
+    results: list[TMDbTvSearchResult] = []
 
 
 class TMDbAPIError(Exception):
@@ -173,53 +207,114 @@ class TMDbClient:
 
     BASE_URL = "https://api.themoviedb.org/3"
     IMAGE_BASE_URL = "https://image.tmdb.org/t/p/"
-
-    def __init__(self) -> None:
+    CACHE_TTL_SECONDS = 3600.0
+    CACHE_MAX_ENTRIES = 2048
+    POOL_LIMITS = httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=60.0,
+    )
+    # One details lookup per keep-alive connection, so bursts reuse warm ones.
+    DETAILS_CONCURRENCY = POOL_LIMITS.max_keepalive_connections
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+    ) -> None:
         """Initialize TMDb client.
         
         Args:
-            api_key: TMDb API key (v3 auth)
-            access_token: TMDb API Read Access Token (Bearer token, preferred)
+            api_key: TMDb API key (v3 auth), defaults to ``TMDB_API_KEY``
+            access_token: TMDb API Read Access Token (Bearer token, preferred),
+                defaults to ``TMDB_ACCESS_TOKEN``
         """
-        self.api_key = TMDB_API_KEY
-        self.access_token = TMDB_ACCESS_TOKEN
-        self._client = httpx.AsyncClient(timeout=30.0)
-
-    def _get_headers(self) -> dict[str, str]:
-        """Get authentication headers for API requests."""
+        self.api_key = api_key or TMDB_API_KEY
+        self.access_token = access_token or TMDB_ACCESS_TOKEN
+        # HTTP/2 (when h2 is installed) multiplexes concurrent lookups over a
+        # single pooled connection instead of paying a TLS handshake per call.
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=30.0,
+            http2=_HTTP2_AVAILABLE,
+            limits=self.POOL_LIMITS,
+        )
+        # Credentials are fixed for the client's lifetime, so build the auth
+        # headers and query parameters once instead of on every request.
         if self.access_token:
             # Prefer Bearer token authentication
-            return {
+            self._headers = {
                 "Authorization": f"Bearer {self.access_token}",
                 "accept": "application/json",
             }
-        return {"accept": "application/json"}
+            self._api_key_param: dict[str, Any] = {}
+        else:
+            self._headers = {"accept": "application/json"}
+            self._api_key_param = {"api_key": self.api_key}
+        # Metadata is read-mostly, so decoded responses are kept for an hour.
+        self._cache: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._cache_locks: dict[Hashable, asyncio.Lock] = {}
+
+    async def _gather_bounded(
+        self,
+        fetch: Callable[[Any], Awaitable[Any]],
+        ids: Iterable[Any],
+        concurrency: int,
+    ) -> list[Any]:
+        """Run ``fetch`` for every id, at most ``concurrency`` at a time, in order."""
+        semaphore = asyncio.Semaphore(concurrency)
 
-    def _get_params(self, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Get query parameters with API key if not using Bearer token."""
-        base_params = params or {}
-        if not self.access_token:
-            base_params["api_key"] = self.api_key
-        return base_params
+        async def one(item: Any) -> Any:
+            async with semaphore:
+                return await fetch(item)
 
-    async def _request(
+        return await asyncio.gather(*(one(item) for item in ids))
+
+    async def _cached(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key``, loading it at most once per TTL.
+
+        Concurrent misses on the same key wait on a shared lock so only one
+        request goes out. Once full, the least recently used entry is evicted.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return entry[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    self._cache.move_to_end(key)
+                    return entry[1]
+                value = await load()
+                self._cache.pop(key, None)
+                if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+                self._cache[key] = (time.monotonic() + self.CACHE_TTL_SECONDS, value)
+        finally:
+            # A later generation of waiters may already hold a newer lock.
+            if self._cache_locks.get(key) is lock:
+                del self._cache_locks[key]
+        return value
+
+    async def _fetch(
         self, method: str, endpoint: str, params: dict[str, Any] | None = None
-    ) -> dict[str, Any]:
-        """Make an authenticated request to the TMDb API."""
-        url = f"{self.BASE_URL}/{endpoint}"
-        headers = self._get_headers()
-        query_params = self._get_params(params)
+    ) -> bytes:
+        """Make an authenticated request and return the raw response body."""
+        query_params = params | self._api_key_param if params else self._api_key_param
 
         try:
             response = await self._client.request(
-                method, url, headers=headers, params=query_params
+                method, endpoint, headers=self._headers, params=query_params
             )
             response.raise_for_status()
-            return response.json()
+            return response.content
         except httpx.HTTPStatusError as e:
             error_data = {}
             try:
-                error_data = e.response.json()
+                error_data = json_loads(e.response.content)
             except Exception:  # noqa: S110
                 pass
             error_message = error_data.get("status_message", str(e))
@@ -227,6 +322,27 @@ class TMDbClient:
         except httpx.RequestError as e:
             raise TMDbAPIError(0, f"Request failed: {str(e)}") from e
 
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        decode_type: Any = None,
+    ) -> Any:
+        """Make an authenticated request to the TMDb API.
+
+        With ``decode_type`` set, the body is decoded straight into that msgspec
+        type; otherwise it is parsed into plain dicts and lists.
+        """
+        content = await self._fetch(method, endpoint, params)
+        if decode_type is None:
+            return json_loads(content)
+        try:
+            return msgspec.json.decode(content, type=decode_type)
+        except msgspec.ValidationError as e:
+            raise TMDbAPIError(0, f"Unexpected response shape: {e}") from e
+
     async def search_movie(
         self,
         query: str,
@@ -242,6 +358,7 @@ class TMDbClient:
 
         page = 1
         movies: list[MovieMedia] = []
+        to_media = self._movie_media_from_search_result
 
         while len(movies) < limit:
             params: dict[str, Any] = {
@@ -257,19 +374,29 @@ class TMDbClient:
             if region:
                 params["region"] = region
 
-            data = await self._request("GET", "search/movie", params)
-            results = data.get("results", [])
+            cache_key = (
+                _SEARCH_MOVIE,
+                query.casefold(),
+                year,
+                primary_release_year,
+                page,
+                language,
+                region,
+                include_adult,
+            )
+            data = await self._cached(
+                cache_key,
+                lambda params=params: self._request(
+                    "GET", _SEARCH_MOVIE, params, decode_type=_MovieSearchResponse
+                ),
+            )
+            results = data.results
             if not results:
                 break
 
-            for item in results:
-                parsed = self._parse_movie_search_result(item)
-                movie = self._movie_media_from_search_result(parsed)
-                movies.append(movie)
-                if len(movies) >= limit:
-                    break
+            movies.extend([to_media(parsed) for parsed in results[: limit - len(movies)]])
 
-            total_pages = data.get("total_pages") or 1
+            total_pages = data.total_pages or 1
             if page >= total_pages:
                 break
             page += 1
@@ -297,71 +424,13 @@ class TMDbClient:
         if append_to_response:
             params["append_to_response"] = ",".join(append_to_response)
 
-        data = await self._request("GET", f"movie/{movie_id}", params)
+        async def load() -> TMDbMovie:
+            content = await self._fetch("GET", f"movie/{movie_id}", params)
+            return self._decode_details(content, TMDbMovie)
 
-        # Parse genres
-        genres = [
-            TMDbGenre(id=g["id"], name=g["name"]) for g in data.get("genres", [])
-        ]
+        cache_key = ("movie", movie_id, language, tuple(append_to_response or ()))
+        tmdb_movie = await self._cached(cache_key, load)
 
-        # Parse production companies
-        companies = [
-            TMDbProductionCompany(
-                id=c["id"],
-                name=c["name"],
-                logo_path=c.get("logo_path"),
-                origin_country=c.get("origin_country", ""),
-            )
-            for c in data.get("production_companies", [])
-        ]
-
-        # Parse production countries
-        countries = [
-            TMDbProductionCountry(
-                iso_3166_1=c["iso_3166_1"],
-                name=c["name"],
-            )
-            for c in data.get("production_countries", [])
-        ]
-
-        # Parse spoken languages
-        languages = [
-            TMDbSpokenLanguage(
-                iso_639_1=lang["iso_639_1"],
-                name=lang["name"],
-                english_name=lang.get("english_name", lang["name"]),
-            )
-            for lang in data.get("spoken_languages", [])
-        ]
-
-        # Build TMDbMovie for internal use
-        tmdb_movie = TMDbMovie(
-            id=data["id"],
-            title=data.get("title", ""),
-            original_title=data.get("original_title", ""),
-            tagline=data.get("tagline"),
-            overview=data.get("overview"),
-            release_date=data.get("release_date"),
-            runtime=data.get("runtime"),
-            status=data.get("status", ""),
-            budget=data.get("budget", 0),
-            revenue=data.get("revenue", 0),
-            homepage=data.get("homepage"),
-            imdb_id=data.get("imdb_id"),
-            poster_path=data.get("poster_path"),
-            backdrop_path=data.get("backdrop_path"),
-            popularity=data.get("popularity", 0.0),
-            vote_average=data.get("vote_average", 0.0),
-            vote_count=data.get("vote_count", 0),
-            adult=data.get("adult", False),
-            original_language=data.get("original_language", ""),
-            genres=genres,
-            production_companies=companies,
-            production_countries=countries,
-            spoken_languages=languages,
-            raw_data=data,
-        )
-        
         # Convert to MovieMedia with placeholder file fields
         return self.to_movie_media(
             tmdb_movie=tmdb_movie,
@@ -371,6 +440,27 @@ class TMDbClient:
             file_format=None,
         )
 
+    async def get_movie_details_many(
+        self,
+        movie_ids: Iterable[int],
+        *,
+        concurrency: int | None = None,
+        language: str = "en-US",
+        append_to_response: Optional[list[str]] = None,
+    ) -> list["MovieMedia"]:
+        """Fetch details for several movies concurrently.
+
+        Requests overlap on the pooled connections instead of running one
+        round-trip at a time. Results are returned in the order of ``movie_ids``.
+        """
+        return await self._gather_bounded(
+            lambda movie_id: self.get_movie_details(
+                movie_id, language=language, append_to_response=append_to_response
+            ),
+            movie_ids,
+            concurrency or self.DETAILS_CONCURRENCY,
+        )
+
     async def search_tv(
         self,
         query: str,
@@ -401,29 +491,19 @@ class TMDbClient:
         if first_air_date_year is not None:
             params["first_air_date_year"] = first_air_date_year
 
-        data = await self._request("GET", "search/tv", params)
-        results = []
-        
-        for item in data.get("results", []):
-            results.append(
-                TMDbTvSearchResult(
-                    id=item["id"],
-                    name=item.get("name", ""),
-                    original_name=item.get("original_name", ""),
-                    first_air_date=item.get("first_air_date"),
-                    overview=item.get("overview"),
-                    poster_path=item.get("poster_path"),
-                    backdrop_path=item.get("backdrop_path"),
-                    popularity=item.get("popularity", 0.0),
-                    vote_average=item.get("vote_average", 0.0),
-                    vote_count=item.get("vote_count", 0),
-                    origin_country=item.get("origin_country", []),
-                    original_language=item.get("original_language", ""),
-                    genre_ids=item.get("genre_ids", []),
-                )
-            )
-        
-        return results
+        cache_key = (
+            _SEARCH_TV,
+            query.casefold(),
+            first_air_date_year,
+            page,
+            language,
+            include_adult,
+        )
+        data = await self._cached(
+            cache_key,
+            lambda: self._request("GET", _SEARCH_TV, params, decode_type=_TvSearchResponse),
+        )
+        return list(data.results)
 
     async def get_tv_details(
         self,
@@ -446,73 +526,13 @@ class TMDbClient:
         if append_to_response:
             params["append_to_response"] = ",".join(append_to_response)
 
-        data = await self._request("GET", f"tv/{tv_id}", params)
+        async def load() -> TMDbTvShow:
+            content = await self._fetch("GET", f"tv/{tv_id}", params)
+            return self._decode_details(content, TMDbTvShow)
 
-        # Parse genres
-        genres = [
-            TMDbGenre(id=g["id"], name=g["name"]) for g in data.get("genres", [])
-        ]
+        cache_key = ("tv", tv_id, language, tuple(append_to_response or ()))
+        tmdb_tv = await self._cached(cache_key, load)
 
-        # Parse production companies
-        companies = [
-            TMDbProductionCompany(
-                id=c["id"],
-                name=c["name"],
-                logo_path=c.get("logo_path"),
-                origin_country=c.get("origin_country", ""),
-            )
-            for c in data.get("production_companies", [])
-        ]
-
-        # Parse production countries
-        countries = [
-            TMDbProductionCountry(
-                iso_3166_1=c["iso_3166_1"],
-                name=c["name"],
-            )
-            for c in data.get("production_countries", [])
-        ]
-
-        # Parse spoken languages
-        languages = [
-            TMDbSpokenLanguage(
-                iso_639_1=lang["iso_639_1"],
-                name=lang["name"],
-                english_name=lang.get("english_name", lang["name"]),
-            )
-            for lang in data.get("spoken_languages", [])
-        ]
-
-        # Build TMDbTvShow for internal use
-        tmdb_tv = TMDbTvShow(
-            id=data["id"],
-            name=data.get("name", ""),
-            original_name=data.get("original_name", ""),
-            tagline=data.get("tagline"),
-            overview=data.get("overview"),
-            first_air_date=data.get("first_air_date"),
-            last_air_date=data.get("last_air_date"),
-            status=data.get("status", ""),
-            type=data.get("type", ""),
-            number_of_seasons=data.get("number_of_seasons", 0),
-            number_of_episodes=data.get("number_of_episodes", 0),
-            homepage=data.get("homepage"),
-            poster_path=data.get("poster_path"),
-            backdrop_path=data.get("backdrop_path"),
-            popularity=data.get("popularity", 0.0),
-            vote_average=data.get("vote_average", 0.0),
-            vote_count=data.get("vote_count", 0),
-            original_language=data.get("original_language", ""),
-            origin_country=data.get("origin_country", []),
-            genres=genres,
-            production_companies=companies,
-            production_countries=countries,
-            spoken_languages=languages,
-            networks=data.get("networks", []),
-            created_by=data.get("created_by", []),
-            raw_data=data,
-        )
-        
         # Convert to TvShowMedia with placeholder file fields
         return self.to_tv_show_media(
             tmdb_tv=tmdb_tv,
@@ -522,6 +542,27 @@ class TMDbClient:
             file_format=None,
         )
 
+    async def get_tv_details_many(
+        self,
+        tv_ids: Iterable[int],
+        *,
+        concurrency: int | None = None,
+        language: str = "en-US",
+        append_to_response: Optional[list[str]] = None,
+    ) -> list["TvShowMedia"]:
+        """Fetch details for several TV shows concurrently.
+
+        Requests overlap on the pooled connections instead of running one
+        round-trip at a time. Results are returned in the order of ``tv_ids``.
+        """
+        return await self._gather_bounded(
+            lambda tv_id: self.get_tv_details(
+                tv_id, language=language, append_to_response=append_to_response
+            ),
+            tv_ids,
+            concurrency or self.DETAILS_CONCURRENCY,
+        )
+
     def get_image_url(
         self, path: Optional[str], size: str = "original"
     ) -> Optional[str]:
@@ -539,22 +580,16 @@ class TMDbClient:
             return None
         return f"{self.IMAGE_BASE_URL}{size}{path}"
 
-    def _parse_movie_search_result(self, item: dict[str, Any]) -> TMDbSearchResult:
-        return TMDbSearchResult(
-            id=item.get("id"),
-            title=item.get("title", ""),
-            original_title=item.get("original_title", ""),
-            release_date=item.get("release_date"),
-            overview=item.get("overview"),
-            poster_path=item.get("poster_path"),
-            backdrop_path=item.get("backdrop_path"),
-            popularity=item.get("popularity", 0.0),
-            vote_average=item.get("vote_average", 0.0),
-            vote_count=item.get("vote_count", 0),
-            adult=item.get("adult", False),
-            original_language=item.get("original_language", ""),
-            genre_ids=item.get("genre_ids", []) or [],
-        )
+    def _decode_details(self, content: bytes, decode_type: Any) -> Any:
+        """Decode a details payload into ``decode_type`` in a single pass.
+
+        Keys the Struct does not declare (videos, images, ...) are skipped by
+        the decoder instead of being kept around as a parsed dict.
+        """
+        try:
+            return msgspec.json.decode(content, type=decode_type)
+        except msgspec.ValidationError as e:
+            raise TMDbAPIError(0, f"Unexpected response shape: {e}") from e
 
     def _movie_media_from_search_result(self, result: TMDbSearchResult) -> "MovieMedia":
         from domain.media.base import ImageMetadata
@@ -572,14 +607,14 @@ class TMDbClient:
         poster = None
         poster_url = self.get_image_url(result.poster_path, size="w500")
         if poster_url:
-            poster = ImageMetadata(file_path=poster_url, width=None, height=None, aspect_ratio=None)
+            poster = ImageMetadata(file_path=poster_url)
 
         backdrop = None
         backdrop_url = self.get_image_url(result.backdrop_path, size="original")
         if backdrop_url:
-            backdrop = ImageMetadata(file_path=backdrop_url, width=None, height=None, aspect_ratio=None)
+            backdrop = ImageMetadata(file_path=backdrop_url)
 
-        languages = [result.original_language] if result.original_language else None
+        languages = _intern_all((result.original_language,)) or None
 
         return MovieMedia(
             file_hash=None,
@@ -642,39 +677,34 @@ class TMDbClient:
         
         # Extract cast names
         cast_names = None
-        if "credits" in tmdb_movie.raw_data:
-            credits = tmdb_movie.raw_data["credits"]
-            cast_data = credits.get("cast", [])[:20]  # Top 20 cast members
+        if tmdb_movie.credits is not None:
+            cast_data = tmdb_movie.credits.cast[:20]  # Top 20 cast members
             if cast_data:
-                cast_names = [member.get("name") for member in cast_data if member.get("name")]
+                cast_names = [member.name for member in cast_data if member.name]
         
         # Extract genres
         genres = None
         if tmdb_movie.genres:
-            genres = [g.name for g in tmdb_movie.genres]
+            genres = _intern_all(g.name for g in tmdb_movie.genres)
         
         # Extract languages
         languages = None
         if tmdb_movie.spoken_languages:
-            languages = [lang.english_name for lang in tmdb_movie.spoken_languages]
+            languages = _intern_all(
+                lang.english_name or lang.name for lang in tmdb_movie.spoken_languages
+            )
         
         # Create poster and backdrop metadata
         poster = None
         if tmdb_movie.poster_path:
             poster = ImageMetadata(
-                file_path=self.get_image_url(tmdb_movie.poster_path, size="w500") or tmdb_movie.poster_path,
-                width=None,
-                height=None,
-                aspect_ratio=None,
+                file_path=self.get_image_url(tmdb_movie.poster_path, size="w500") or tmdb_movie.poster_path
             )
         
         backdrop = None
         if tmdb_movie.backdrop_path:
             backdrop = ImageMetadata(
-                file_path=self.get_image_url(tmdb_movie.backdrop_path, size="original") or tmdb_movie.backdrop_path,
-                width=None,
-                height=None,
-                aspect_ratio=None,
+                file_path=self.get_image_url(tmdb_movie.backdrop_path, size="original") or tmdb_movie.backdrop_path
             )
         
         return MovieMedia(
@@ -743,39 +773,34 @@ class TMDbClient:
         
         # Extract cast names
         cast_names = None
-        if "credits" in tmdb_tv.raw_data:
-            credits = tmdb_tv.raw_data["credits"]
-            cast_data = credits.get("cast", [])[:20]  # Top 20 cast members
+        if tmdb_tv.credits is not None:
+            cast_data = tmdb_tv.credits.cast[:20]  # Top 20 cast members
             if cast_data:
-                cast_names = [member.get("name") for member in cast_data if member.get("name")]
+                cast_names = [member.name for member in cast_data if member.name]
         
         # Extract genres
         genres = None
         if tmdb_tv.genres:
-            genres = [g.name for g in tmdb_tv.genres]
+            genres = _intern_all(g.name for g in tmdb_tv.genres)
         
         # Extract languages
         languages = None
         if tmdb_tv.spoken_languages:
-            languages = [lang.english_name for lang in tmdb_tv.spoken_languages]
+            languages = _intern_all(
+                lang.english_name or lang.name for lang in tmdb_tv.spoken_languages
+            )
         
         # Create poster and backdrop metadata
         poster = None
         if tmdb_tv.poster_path:
             poster = ImageMetadata(
-                file_path=self.get_image_url(tmdb_tv.poster_path, size="w500") or tmdb_tv.poster_path,
-                width=None,
-                height=None,
-                aspect_ratio=None,
+                file_path=self.get_image_url(tmdb_tv.poster_path, size="w500") or tmdb_tv.poster_path
             )
         
         backdrop = None
         if tmdb_tv.backdrop_path:
             backdrop = ImageMetadata(
-                file_path=self.get_image_url(tmdb_tv.backdrop_path, size="original") or tmdb_tv.backdrop_path,
-                width=None,
-                height=None,
-                aspect_ratio=None,
+                file_path=self.get_image_url(tmdb_tv.backdrop_path, size="original") or tmdb_tv.backdrop_path
             )
         
         return TvShowMedia(
@@ -815,8 +840,17 @@ class TMDbClient:
         await self.close()
 
 
-def get_tmdb_client(api_key: str, access_token: Optional[str] = None) -> TMDbClient:
-    """Factory function to create a TMDb client instance.
+_tmdb_clients: dict[tuple[Optional[str], Optional[str]], TMDbClient] = {}
+
+
+def get_tmdb_client(
+    api_key: Optional[str] = None, access_token: Optional[str] = None
+) -> TMDbClient:
+    """Return the shared TMDb client for the given credentials.
+    
+    Clients are cached per ``(api_key, access_token)`` so every caller reuses
+    one connection pool. Callers must not close the returned client; use
+    :func:`close_tmdb_clients` on shutdown instead.
     
     Args:
         api_key: TMDb API key
@@ -825,4 +859,16 @@ def get_tmdb_client(api_key: str, access_token: Optional[str] = None) -> TMDbCli
     Returns:
         Configured TMDb client
     """
-    return TMDbClient(api_key=api_key, access_token=access_token)
+    key = (api_key, access_token)
+    client = _tmdb_clients.get(key)
+    if client is None:
+        client = _tmdb_clients[key] = TMDbClient(api_key=api_key, access_token=access_token)
+    return client
+
+
+async def close_tmdb_clients() -> None:
+    """Close and forget every shared TMDb client."""
+    clients = list(_tmdb_clients.values())
+    _tmdb_clients.clear()
+    for client in clients:
+        await client.close()
@@ -10,12 +10,25 @@ LogLevel = Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"]
 
 console = Console()
 
+PLAIN_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
 
 def configure_logging(level: LogLevel = "INFO") -> None:
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)],
-    )
+    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    # LogRecord otherwise looks these up for every record, and no format uses them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    if console.is_terminal:
+        # Rich rendering is for someone watching a terminal; redirected output
+        # (containers, service managers) gets the plain formatter.
+        handler: logging.Handler = RichHandler(
+            console=console, rich_tracebacks=numeric_level <= logging.DEBUG
+        )
+        fmt, datefmt = "%(message)s", "[%X]"
+    else:
+        handler = logging.StreamHandler()
+        fmt, datefmt = PLAIN_FORMAT, None
 
+    logging.basicConfig(level=numeric_level, format=fmt, datefmt=datefmt, handlers=[handler])
@@ -1,25 +1,54 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.metadata.tmdb.client import close_tmdb_clients
 from infrastructure.ann import get_ann_service
 from router.v1.router import api_router
 from db.init import init_db
 from app.settings import get_settings
 from app.logging import configure_logging
+from app.responses import AppJSONResponse
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
     configure_logging(settings.server.log_level)
 
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        logger = logging.getLogger(__name__)
+        logger.info("BitHarbor backend starting up.")
+        await init_db()
+        logger.info("Database schema ensured.")
+        ann_service = None
+        if settings.ann.enabled:
+            try:
+                # Build the singleton and page its vectors and index in off the
+                # event loop, before the first query arrives.
+                ann_service = await asyncio.to_thread(get_ann_service)
+                await asyncio.to_thread(ann_service.warmup)
+                ann_service.start()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("ANN service initialisation failed: %s", exc, exc_info=True)
+        yield
+        logger.info("BitHarbor backend shutting down.")
+        if ann_service is not None:
+            await ann_service.stop()
+        await close_tmdb_clients()
+
     app = FastAPI(
         title="BitHarbor",
         version="0.1.0",
         description="Local-first media server backend.",
+        default_response_class=AppJSONResponse,
+        lifespan=lifespan,
     )
 
     app.add_middleware(
@@ -30,22 +59,6 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    @app.on_event("startup")
-    async def on_startup() -> None:
-        logger = logging.getLogger(__name__)
-        logger.info("BitHarbor backend starting up.")
-        await init_db()
-        logger.info("Database schema ensured.")
-        if settings.ann.enabled:
-            try:
-                _ = get_ann_service()
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("ANN service initialisation failed: %s", exc, exc_info=True)
-
-    @app.on_event("shutdown")
-    async def on_shutdown() -> None:
-        logging.getLogger(__name__).info("BitHarbor backend shutting down.")
-
     @app.get("/healthz", tags=["system"])
     async def healthcheck() -> dict[str, str]:
         return {"status": "ok"}
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Mapping
+
+import anyio
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class AppJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, including numpy values.
+
+    Routes may also return pydantic models as ``content`` directly; they are
+    dumped in JSON mode without going through ``jsonable_encoder``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+class FileRangeResponse(Response):
+    """Stream the byte range ``start..end`` (inclusive) of a file.
+
+    Chunks are read with ``os.pread`` on a single descriptor in a worker
+    thread, and the kernel is told the access is sequential so readahead keeps
+    ahead of the client. When the server implements the ASGI ``pathsend``
+    extension and the whole file is requested, the path is handed to the
+    server instead, letting it use ``sendfile(2)`` with no userspace copy.
+    """
+
+    chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        path: Path,
+        start: int,
+        end: int,
+        *,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+    ) -> None:
+        self.path = path
+        self.start = start
+        self.end = end
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if scope.get("method") == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        whole_file = self.start == 0 and self.end + 1 == os.stat(self.path).st_size
+        if whole_file and "http.response.pathsend" in scope.get("extensions", {}):
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            remaining = self.end - self.start + 1
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, self.start, remaining, os.POSIX_FADV_SEQUENTIAL)
+            offset = self.start
+            while remaining > 0:
+                chunk = await anyio.to_thread.run_sync(
+                    os.pread, fd, min(self.chunk_size, remaining), offset
+                )
+                if not chunk:
+                    break
+                offset += len(chunk)
+                remaining -= len(chunk)
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": remaining > 0}
+                )
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            os.close(fd)
@@ -3,11 +3,10 @@ from __future__ import annotations
 import os
 import secrets
 from pathlib import Path
-from functools import lru_cache
 from typing import Literal
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -50,10 +49,15 @@ class ServerSettings(BaseModel):
 class DatabaseSettings(BaseModel):
     url: str = "sqlite+aiosqlite:////var/lib/bitharbor/bitharbor.sqlite"
     echo: bool = False
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_recycle_s: int = 1800
 
 
 class SecuritySettings(BaseModel):
-    secret_key: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
+    # Empty means "load or create <data_root>/secret_key" in get_settings, so
+    # every worker process signs tokens with the same key.
+    secret_key: str = ""
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24  # 24 hours
 
@@ -65,6 +69,11 @@ class EmbeddingSettings(BaseModel):
     video_frames: int = 8
     fuse_poster_weight: float = 0.2
     round_eps: float = 1e-6
+    # Faster CUDA inference; both change vectors slightly, and so their hashes.
+    # compile_model does not lift torch's deterministic mode, but compiled
+    # kernels still make hashes differ from eager runs.
+    compile_model: bool = False
+    half_precision: bool = False
 
 
 class AnnSettings(BaseModel):
@@ -76,6 +85,9 @@ class AnnSettings(BaseModel):
     search_memory_budget: float = 2.0  # GB
     num_threads: int = 0  # 0 == auto
     rebuild_batch: int = 1
+    rebuild_interval_s: float = 30.0
+    # Storage for the per-media exact-search vector files; int8 is 4x smaller.
+    vector_dtype: Literal["float32", "int8"] = "float32"
     vectors_path: Path = _DEFAULT_VECTORS_PATH
     index_directory: Path = _DEFAULT_INDEX_DIRECTORY
 
@@ -119,15 +131,64 @@ class AppSettings(BaseSettings):
     tmdb: TMDbSettings = TMDbSettings()
 
     def ensure_directories(self) -> None:
-        self.server.data_root.mkdir(parents=True, exist_ok=True)
-        index_dir = self.ann.index_directory
-        index_dir.mkdir(parents=True, exist_ok=True)
-        vectors_dir = self.ann.vectors_path.parent
-        vectors_dir.mkdir(parents=True, exist_ok=True)
+        directories = dict.fromkeys(
+            (self.server.data_root, self.ann.index_directory, self.ann.vectors_path.parent)
+        )
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+
+
+def _read_secret_key(path: Path) -> str:
+    key = path.read_text().strip()
+    if not key:
+        # Never sign tokens with an empty HS256 key.
+        raise RuntimeError(f"Secret key file {path} is empty; delete it to generate a new key")
+    return key
+
+
+def _load_or_create_secret_key(path: Path) -> str:
+    """Return the key stored at ``path``, creating it atomically if missing."""
+    try:
+        return _read_secret_key(path)
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{secrets.token_hex(8)}")
+    # Created owner-only, so the key is never readable under a looser umask.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(secrets.token_urlsafe(32))
+        # link() refuses to overwrite, so concurrent workers agree on one key.
+        os.link(tmp_path, path)
+    except FileExistsError:
+        pass
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return _read_secret_key(path)
+
+
+_settings: AppSettings | None = None
 
 
-@lru_cache()
 def get_settings() -> AppSettings:
+    # A plain global read is cheaper than an lru_cache hit on the request path.
+    global _settings
+    if _settings is None:
+        _settings = _load_settings()
+    return _settings
+
+
+def _clear_settings() -> None:
+    global _settings
+    _settings = None
+
+
+# Keep the lru_cache-style hook that tests use to reload settings from the env.
+get_settings.cache_clear = _clear_settings  # type: ignore[attr-defined]
+
+
+def _load_settings() -> AppSettings:
     settings = AppSettings()
 
     # Fallback to legacy environment variables for TMDb credentials
@@ -150,5 +211,9 @@ def get_settings() -> AppSettings:
             settings.internet_archive.password = legacy_password
 
     settings.ensure_directories()
+    if not settings.security.secret_key:
+        settings.security.secret_key = _load_or_create_secret_key(
+            settings.server.data_root / "secret_key"
+        )
     return settings
 
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Select, bindparam, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -8,3 +13,26 @@ class Base(DeclarativeBase):
 
     pass
 
+
+@lru_cache(maxsize=None)
+def exists_stmt(column: Any) -> Select[Any]:
+    """``SELECT EXISTS (... WHERE column = :value)``, built once per column.
+
+    Reusing one statement object lets SQLAlchemy skip rebuilding the construct
+    and recomputing its cache key on every lookup.
+    """
+    return select(exists().where(column == bindparam("value")))
+
+
+@lru_cache(maxsize=None)
+def non_null_stmt(column: Any) -> Select[Any]:
+    """``SELECT column WHERE column IS NOT NULL``, built once per column."""
+    return select(column).where(column.isnot(None))
+
+
+async def stream_scalar_set(
+    session: AsyncSession, stmt: Select[Any], batch_size: int = 10_000
+) -> set[Any]:
+    """Collect the non-empty scalars of ``stmt`` into a set, fetching in batches."""
+    result = await session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+    return {value async for value in result if value}
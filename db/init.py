@@ -3,28 +3,66 @@ from __future__ import annotations
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from sqlalchemy import inspect, text
+from sqlalchemy.orm import configure_mappers
 
 from db.base import Base
 from db.session import engine
 import db.models  # noqa: F401
 
 
-async def init_db(custom_engine: AsyncEngine | None = None) -> None:
-    target_engine = custom_engine or engine
-    async with target_engine.begin() as conn:
-        def ensure_columns(connection):
-            inspector = inspect(connection)
-            columns = {col["name"] for col in inspector.get_columns("admin_participant_links")}
-            if "role" not in columns:
-                connection.execute(
-                    text(
-                        "ALTER TABLE admin_participant_links "
-                        "ADD COLUMN role TEXT DEFAULT 'viewer' NOT NULL"
-                    )
+# Auth timestamp columns that used to hold ISO-8601 text and now hold unix seconds.
+_UNIX_TIMESTAMP_COLUMNS = {
+    "admins": ("created_at", "updated_at"),
+    "participants": ("created_at", "updated_at"),
+    "admin_participant_links": ("linked_at",),
+}
+
+# Recorded in SQLite's ``PRAGMA user_version`` once the text timestamps are converted.
+_SQLITE_UNIX_TIMESTAMP_VERSION = 1
+
+
+def _convert_sqlite_timestamps(connection, tables: set[str]) -> None:
+    """One-shot rewrite of legacy ISO-8601 auth timestamps to unix seconds."""
+    if connection.exec_driver_sql("PRAGMA user_version").scalar() >= _SQLITE_UNIX_TIMESTAMP_VERSION:
+        return
+    for table, columns in _UNIX_TIMESTAMP_COLUMNS.items():
+        if table not in tables:
+            continue
+        for column in columns:
+            connection.execute(
+                text(
+                    f"UPDATE {table} SET {column} = CAST(strftime('%s', {column}) AS INTEGER) "
+                    f"WHERE typeof({column}) = 'text'"
                 )
+            )
+    connection.exec_driver_sql(f"PRAGMA user_version = {_SQLITE_UNIX_TIMESTAMP_VERSION}")
 
-        tables = await conn.run_sync(lambda connection: inspect(connection).get_table_names())
-        if "admin_participant_links" in tables:
-            await conn.run_sync(ensure_columns)
-        await conn.run_sync(Base.metadata.create_all)
 
+def _bootstrap_schema(connection) -> None:
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    # Only SQLite databases predate the unix timestamp columns.
+    if connection.dialect.name == "sqlite":
+        _convert_sqlite_timestamps(connection, tables)
+    if "admin_participant_links" in tables:
+        columns = {col["name"] for col in inspector.get_columns("admin_participant_links")}
+        if "role" not in columns:
+            connection.execute(
+                text(
+                    "ALTER TABLE admin_participant_links "
+                    "ADD COLUMN role TEXT DEFAULT 'viewer' NOT NULL"
+                )
+            )
+    Base.metadata.create_all(connection)
+    # create_all skips indexes on tables that already exist; add any new ones.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+async def init_db(custom_engine: AsyncEngine | None = None) -> None:
+    target_engine = custom_engine or engine
+    async with target_engine.begin() as conn:
+        await conn.run_sync(_bootstrap_schema)
+    # Resolve relationships now rather than inside the first request's query.
+    configure_mappers()
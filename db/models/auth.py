@@ -3,11 +3,12 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, DateTime, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Text, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from passlib.context import CryptContext
 
-from db.base import Base
+from db.base import Base, exists_stmt
+from db.types import UnixTimestamp, unix_now
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -17,6 +18,8 @@ class Admin(Base):
     """Admin user with authentication capabilities."""
     
     __tablename__ = "admins"
+    # Fetch the SQL-side timestamps via RETURNING instead of expiring them.
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     admin_id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -29,9 +32,15 @@ class Admin(Base):
     display_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        UnixTimestamp, default=unix_now(), server_default=unix_now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        UnixTimestamp,
+        default=unix_now(),
+        server_default=unix_now(),
+        onupdate=unix_now(),
+        nullable=False,
     )
     
     # Relationships
@@ -53,23 +62,21 @@ class Admin(Base):
     def get_all_hashes(cls, session) -> list[str]:
         """Get all password hashes (for migration/admin purposes only)."""
         from sqlalchemy import select
-        result = session.execute(select(cls.hashed_password))
-        return [row[0] for row in result.all()]
+        return list(session.scalars(select(cls.hashed_password)))
     
     @classmethod
     async def hash_exists(cls, session, password_hash: str) -> bool:
         """Check if a password hash already exists (unlikely but for completeness)."""
-        from sqlalchemy import select
-        result = await session.execute(
-            select(cls).where(cls.hashed_password == password_hash)
+        return bool(
+            await session.scalar(exists_stmt(cls.hashed_password), {"value": password_hash})
         )
-        return result.scalar_one_or_none() is not None
 
 
 class Participant(Base):
     """Participant associated with admin accounts."""
     
     __tablename__ = "participants"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     participant_id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -84,9 +91,15 @@ class Participant(Base):
     preferences_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        UnixTimestamp, default=unix_now(), server_default=unix_now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        UnixTimestamp,
+        default=unix_now(),
+        server_default=unix_now(),
+        onupdate=unix_now(),
+        nullable=False,
     )
     
     # Relationships
@@ -115,4 +128,6 @@ class AdminParticipantLink(Base):
     role: Mapped[str] = mapped_column(String(50), default="viewer", nullable=False)
     
     # When the association was created
-    linked_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    linked_at: Mapped[datetime] = mapped_column(
+        UnixTimestamp, default=unix_now(), server_default=unix_now(), nullable=False
+    )
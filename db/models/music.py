@@ -3,16 +3,17 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, Integer, String, Text
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from db.base import Base
+from db.base import Base, exists_stmt, non_null_stmt, stream_scalar_set
 
 
 class MusicTrack(Base):
     """Flattened music track metadata."""
 
     __tablename__ = "music_tracks"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -24,7 +25,7 @@ class MusicTrack(Base):
     media_type: Mapped[str] = mapped_column(String(50), default="music", nullable=False)
 
     catalog_source: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    catalog_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    catalog_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     title: Mapped[str] = mapped_column(String(512), nullable=False, index=True)
     artist: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
@@ -43,35 +44,34 @@ class MusicTrack(Base):
     poster: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     backdrop: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("idx_music_catalog_source_id", "catalog_source", "catalog_id"),
     )
 
     @classmethod
-    async def get_all_hashes(cls, session) -> dict[str, list[str]]:
+    async def get_all_hashes(cls, session) -> dict[str, set[str]]:
         """Get all hashes in the table."""
 
-        from sqlalchemy import select
-
-        result = await session.execute(
-            select(cls.file_hash, cls.embedding_hash).where(
-                cls.file_hash.isnot(None) | cls.embedding_hash.isnot(None)
-            )
-        )
-        rows = result.all()
         return {
-            "file_hashes": [row[0] for row in rows if row[0]],
-            "embedding_hashes": [row[1] for row in rows if row[1]],
+            "file_hashes": await stream_scalar_set(session, non_null_stmt(cls.file_hash)),
+            "embedding_hashes": await stream_scalar_set(session, non_null_stmt(cls.embedding_hash)),
         }
 
     @classmethod
     async def hash_exists(cls, session, embedding_hash: str) -> bool:
         """Check if an embedding hash already exists in the table."""
 
-        from sqlalchemy import select
-
-        result = await session.execute(
-            select(cls).where(cls.embedding_hash == embedding_hash)
+        return bool(
+            await session.scalar(exists_stmt(cls.embedding_hash), {"value": embedding_hash})
         )
-        return result.scalar_one_or_none() is not None
@@ -3,16 +3,17 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, Float, DateTime, Text, JSON, ForeignKey, Index
+from sqlalchemy import String, Integer, Float, DateTime, Text, JSON, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from db.base import Base
+from db.base import Base, exists_stmt, non_null_stmt, stream_scalar_set
 
 
 class PodcastShow(Base):
     """Podcast show metadata."""
     
     __tablename__ = "podcast_shows"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -42,9 +43,15 @@ class PodcastShow(Base):
     backdrop: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
     
     # Relationships
@@ -59,6 +66,7 @@ class PodcastEpisode(Base):
     """Podcast episode metadata."""
     
     __tablename__ = "podcast_episodes"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -68,7 +76,6 @@ class PodcastEpisode(Base):
         Integer,
         ForeignKey("podcast_shows.id", ondelete="CASCADE"),
         nullable=False,
-        index=True
     )
     
     # Hashes - embedding_hash is unique
@@ -95,9 +102,15 @@ class PodcastEpisode(Base):
     backdrop: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
     
     # Relationships
@@ -108,25 +121,16 @@ class PodcastEpisode(Base):
     )
     
     @classmethod
-    async def get_all_hashes(cls, session) -> dict[str, list[str]]:
+    async def get_all_hashes(cls, session) -> dict[str, set[str]]:
         """Get all hashes in the table."""
-        from sqlalchemy import select
-        result = await session.execute(
-            select(cls.file_hash, cls.embedding_hash).where(
-                cls.file_hash.isnot(None) | cls.embedding_hash.isnot(None)
-            )
-        )
-        rows = result.all()
         return {
-            "file_hashes": [row[0] for row in rows if row[0]],
-            "embedding_hashes": [row[1] for row in rows if row[1]]
+            "file_hashes": await stream_scalar_set(session, non_null_stmt(cls.file_hash)),
+            "embedding_hashes": await stream_scalar_set(session, non_null_stmt(cls.embedding_hash)),
         }
     
     @classmethod
     async def hash_exists(cls, session, embedding_hash: str) -> bool:
         """Check if an embedding hash already exists in the table."""
-        from sqlalchemy import select
-        result = await session.execute(
-            select(cls).where(cls.embedding_hash == embedding_hash)
+        return bool(
+            await session.scalar(exists_stmt(cls.embedding_hash), {"value": embedding_hash})
         )
-        return result.scalar_one_or_none() is not None
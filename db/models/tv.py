@@ -3,16 +3,17 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, Float, DateTime, Text, JSON, ForeignKey, Index
+from sqlalchemy import String, Integer, Float, DateTime, Text, JSON, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from db.base import Base
+from db.base import Base, exists_stmt, non_null_stmt, stream_scalar_set
 
 
 class TvShow(Base):
     """TV show with complete metadata."""
     
     __tablename__ = "tv_shows"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -28,7 +29,7 @@ class TvShow(Base):
     
     # Catalog Info
     catalog_source: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    catalog_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    catalog_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     catalog_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     catalog_downloads: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
@@ -62,9 +63,15 @@ class TvShow(Base):
     backdrop: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
     
     # Relationships
@@ -79,6 +86,7 @@ class TvSeason(Base):
     """TV season metadata."""
     
     __tablename__ = "tv_seasons"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -88,7 +96,6 @@ class TvSeason(Base):
         Integer,
         ForeignKey("tv_shows.id", ondelete="CASCADE"),
         nullable=False,
-        index=True
     )
     
     # Hashes - embedding_hash is unique
@@ -102,7 +109,7 @@ class TvSeason(Base):
     
     # Catalog Info
     catalog_source: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    catalog_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    catalog_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     
     # Basic Info
     name: Mapped[str] = mapped_column(String(512), nullable=False)
@@ -114,9 +121,15 @@ class TvSeason(Base):
     backdrop: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
     
     # Relationships
@@ -137,6 +150,7 @@ class TvEpisode(Base):
     """TV episode metadata."""
     
     __tablename__ = "tv_episodes"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -146,7 +160,6 @@ class TvEpisode(Base):
         Integer,
         ForeignKey("tv_seasons.id", ondelete="CASCADE"),
         nullable=False,
-        index=True
     )
     
     # Hashes - embedding_hash is unique
@@ -174,9 +187,15 @@ class TvEpisode(Base):
     backdrop: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
     
     # Relationships
@@ -187,25 +206,16 @@ class TvEpisode(Base):
     )
     
     @classmethod
-    async def get_all_hashes(cls, session) -> dict[str, list[str]]:
+    async def get_all_hashes(cls, session) -> dict[str, set[str]]:
         """Get all hashes in the table."""
-        from sqlalchemy import select
-        result = await session.execute(
-            select(cls.file_hash, cls.embedding_hash).where(
-                cls.file_hash.isnot(None) | cls.embedding_hash.isnot(None)
-            )
-        )
-        rows = result.all()
         return {
-            "file_hashes": [row[0] for row in rows if row[0]],
-            "embedding_hashes": [row[1] for row in rows if row[1]]
+            "file_hashes": await stream_scalar_set(session, non_null_stmt(cls.file_hash)),
+            "embedding_hashes": await stream_scalar_set(session, non_null_stmt(cls.embedding_hash)),
         }
     
     @classmethod
     async def hash_exists(cls, session, embedding_hash: str) -> bool:
         """Check if an embedding hash already exists in the table."""
-        from sqlalchemy import select
-        result = await session.execute(
-            select(cls).where(cls.embedding_hash == embedding_hash)
+        return bool(
+            await session.scalar(exists_stmt(cls.embedding_hash), {"value": embedding_hash})
         )
-        return result.scalar_one_or_none() is not None
@@ -1,22 +1,104 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
 
-from app.settings import get_settings
+from app.settings import DatabaseSettings, get_settings
+from utils.serialization import json_dumps, json_loads
 
 settings = get_settings()
 
+
+def _json_serializer(obj) -> str:
+    return json_dumps(obj).decode("utf-8")
+
+
+# WAL lets readers run alongside the single writer; the rest trade durability
+# on power loss (not on crash) and RAM for fewer syscalls and copies.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _engine_options(db: DatabaseSettings) -> dict[str, Any]:
+    url = make_url(db.url)
+    if _is_memory_sqlite(url):
+        # In-memory SQLite uses a single static connection; there is no pool to size.
+        return {"connect_args": {"check_same_thread": False}}
+
+    options: dict[str, Any] = {
+        "pool_size": db.pool_size,
+        "max_overflow": db.max_overflow,
+        # Reuse the most recently returned connection so idle ones can age out.
+        "pool_use_lifo": True,
+    }
+    if url.get_backend_name() == "sqlite":
+        # A local file cannot drop the connection, so skip the per-checkout ping.
+        options["connect_args"] = {"check_same_thread": False}
+    else:
+        options["pool_recycle"] = db.pool_recycle_s
+        options["pool_pre_ping"] = True
+    return options
+
+
 engine = create_async_engine(
     settings.db.url,
     echo=settings.db.echo,
-    pool_pre_ping=True,
-    connect_args={"check_same_thread": False},
+    # JSON columns (poster, backdrop, genres, ...) go through orjson, not stdlib json.
+    json_serializer=_json_serializer,
+    json_deserializer=json_loads,
+    **_engine_options(settings.db),
 )
 
-SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+_url = make_url(settings.db.url)
+if _url.get_backend_name() == "sqlite" and not _is_memory_sqlite(_url):
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+
+class _WriteTrackingSession(Session):
+    """Session that sets ``info["wrote"]`` once it has flushed or may have written.
+
+    Anything other than an ORM ``select()`` counts as a write, including
+    ``text()`` statements, whose effect cannot be told from the statement.
+    """
+
+
+@event.listens_for(_WriteTrackingSession, "after_flush")
+def _mark_flushed(session: Session, _flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(_WriteTrackingSession, "do_orm_execute")
+def _mark_non_select(state: ORMExecuteState) -> None:
+    if not state.is_select:
+        state.session.info["wrote"] = True
+
+
+SessionLocal = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=_WriteTrackingSession,
+)
 
 
 @asynccontextmanager
@@ -24,7 +106,9 @@ async def session_scope() -> AsyncSession:
     session = SessionLocal()
     try:
         yield session
-        await session.commit()
+        # A SELECT autobegins a transaction too, so only commit scopes that wrote.
+        if session.new or session.dirty or session.deleted or session.info.get("wrote"):
+            await session.commit()
     except Exception:
         await session.rollback()
         raise
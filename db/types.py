@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+
+class UnixTimestamp(TypeDecorator):
+    """Naive-UTC ``datetime`` stored as integer unix seconds.
+
+    Rows written before the switch hold ISO-8601 text; those are still parsed on read.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return int(value.timestamp())
+        return int(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+
+
+class unix_now(FunctionElement):
+    """Current unix time in whole seconds, rendered for each dialect."""
+
+    type = BigInteger()
+    inherit_cache = True
+
+
+@compiles(unix_now)
+def _unix_now_default(element, compiler, **kw) -> str:
+    return "CAST(EXTRACT(EPOCH FROM CURRENT_TIMESTAMP) AS BIGINT)"
+
+
+@compiles(unix_now, "sqlite")
+def _unix_now_sqlite(element, compiler, **kw) -> str:
+    # ``unixepoch()`` needs SQLite 3.38.
+    return "CAST(strftime('%s', 'now') AS INTEGER)"
+
+
+@compiles(unix_now, "mysql")
+@compiles(unix_now, "mariadb")
+def _unix_now_mysql(element, compiler, **kw) -> str:
+    return "UNIX_TIMESTAMP()"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from .participant import ParticipantCreate, ParticipantRead
 
@@ -13,10 +13,9 @@ class AdminBase(BaseModel):
 
 
 class AdminRead(AdminBase):
-    admin_id: str
+    model_config = ConfigDict(from_attributes=True)
 
-    class Config:
-        from_attributes = True
+    admin_id: str
 
 
 class AuthSetupRequest(AdminBase):
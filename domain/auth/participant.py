@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class ParticipantBase(BaseModel):
@@ -25,10 +25,9 @@ class ParticipantUpdate(BaseModel):
 
 
 class ParticipantRead(ParticipantBase):
-    participant_id: str
+    model_config = ConfigDict(from_attributes=True)
 
-    class Config:
-        from_attributes = True
+    participant_id: str
 
 
 class ParticipantAssignmentRequest(BaseModel):
@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from .media.base import SourceTypeLiteral
 from .media.movies import MovieMedia
 
+_INGEST_REQUEST_EXAMPLE = {
+    "identifier": "fantastic-planet__1973",
+    "title": "Fantastic Planet",
+    "year": 1973,
+    "download_dir": "/tmp/bitharbor-downloads",
+    "source_type": "catalog",
+    "cleanup_after_ingest": True,
+    "include_subtitles": True,
+}
+
+_SEARCH_REQUEST_EXAMPLE = {
+    "query": "Metropolis",
+    "rows": 10,
+    "sorts": ["downloads desc"],
+    "filters": ["language:eng"],
+}
+
 
 class InternetArchiveIngestRequest(BaseModel):
     """Request to download and ingest a movie from Internet Archive."""
 
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"example": _INGEST_REQUEST_EXAMPLE},
+    )
+
     identifier: str = Field(
         ...,
         min_length=1,
@@ -32,10 +56,9 @@ class InternetArchiveIngestRequest(BaseModel):
         description="Directory for temporary downloads (default: /tmp/bitharbor-downloads)",
         examples=["/tmp/downloads", "/mnt/temp"],
     )
-    source_type: str = Field(
+    source_type: SourceTypeLiteral = Field(
         default="catalog",
         description="Media source type",
-        pattern="^(catalog|home)$",
     )
     cleanup_after_ingest: bool = Field(
         default=True,
@@ -46,23 +69,15 @@ class InternetArchiveIngestRequest(BaseModel):
         description="Download subtitle files (SRT, VTT) if available",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "identifier": "fantastic-planet__1973",
-                "title": "Fantastic Planet",
-                "year": 1973,
-                "download_dir": "/tmp/bitharbor-downloads",
-                "source_type": "catalog",
-                "cleanup_after_ingest": True,
-                "include_subtitles": True,
-            }
-        }
-
 
 class CatalogSearchRequest(BaseModel):
     """Request to search Internet Archive catalog."""
 
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"example": _SEARCH_REQUEST_EXAMPLE},
+    )
+
     query: str = Field(
         ...,
         min_length=1,
@@ -86,20 +101,12 @@ class CatalogSearchRequest(BaseModel):
         examples=[["language:eng"], ["year:[1950 TO 1980]"]],
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "query": "Metropolis",
-                "rows": 10,
-                "sorts": ["downloads desc"],
-                "filters": ["language:eng"],
-            }
-        }
-
 
 class CatalogSearchResult(BaseModel):
     """Single search result from Internet Archive catalog."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     identifier: str = Field(..., description="Internet Archive item identifier")
     title: Optional[str] = Field(None, description="Movie title")
     year: Optional[str] = Field(None, description="Release year")
@@ -109,7 +116,7 @@ class CatalogSearchResult(BaseModel):
     avg_rating: Optional[float] = Field(None, description="Average user rating (0-5)")
     num_reviews: Optional[int] = Field(None, description="Number of user reviews")
     
-    @property
+    @cached_property
     def score(self) -> float:
         """Calculate a ranking score based on downloads and rating.
         
@@ -125,6 +132,8 @@ class CatalogSearchResult(BaseModel):
 class CatalogSearchResponse(BaseModel):
     """Response from catalog search."""
 
+    model_config = ConfigDict(defer_build=True)
+
     results: list[CatalogSearchResult] = Field(default_factory=list)
     total: int = Field(..., description="Total number of results found")
 
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 SourceTypeLiteral = Literal["catalog", "home"]
 
 class ImageMetadata(BaseModel):
     """Image metadata from TMDb."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     file_path: str = Field(..., description="Image file path")
     width: Optional[int] = Field(None, description="Image width in pixels")
     height: Optional[int] = Field(None, description="Image height in pixels")
@@ -3,7 +3,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 
-from .base import BaseMedia, ImageMetadata
+from .base import BaseMedia
 
 class PodcastShowMedia(BaseMedia):
     """Podcast show metadata from enrichment (placeholder for future)."""
@@ -12,8 +12,6 @@ class PodcastShowMedia(BaseMedia):
     podcast_title: str = Field(..., description="Show title")
     publisher: Optional[str] = Field(None, description="Publisher name")
     description: Optional[str] = Field(None, description="Show description")
-    
-    poster: Optional[ImageMetadata] = Field(None, description="Primary poster image path")
 
 
 class PodcastEpisodeMedia(PodcastShowMedia):
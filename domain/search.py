@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from domain.media.movies import MovieMedia
 
@@ -16,6 +16,8 @@ class SearchRequest(BaseModel):
 
 
 class SearchResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     media_id: str
     score: float
     type: MediaTypeLiteral
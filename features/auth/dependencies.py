@@ -13,8 +13,14 @@ from features.auth.service import AuthService
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+_auth_service: AuthService | None = None
+
+
 def get_auth_service() -> AuthService:
-    return AuthService()
+    global _auth_service
+    if _auth_service is None:
+        _auth_service = AuthService()
+    return _auth_service
 
 
 async def get_current_admin(
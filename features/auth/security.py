@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
@@ -11,6 +15,14 @@ from app.settings import SecuritySettings, get_settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+TOKEN_CACHE_SIZE = 4096
+
+# Verified tokens keyed by (sha256(token), algorithm) -> (payload, exp timestamp).
+# Entries are only valid for one signing secret; the cache is cleared when it changes.
+_token_cache: dict[tuple[bytes, str], tuple[Dict[str, Any], float]] = {}
+_token_cache_secret: bytes | None = None
+_token_cache_lock = threading.Lock()
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -20,6 +32,16 @@ def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
 
 
+async def hash_password_async(password: str) -> str:
+    """``hash_password`` in a worker thread; bcrypt releases the GIL while hashing."""
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """``verify_password`` in a worker thread so logins do not stall the event loop."""
+    return await asyncio.to_thread(verify_password, password, hashed)
+
+
 def create_access_token(
     subject: str,
     security: SecuritySettings | None = None,
@@ -35,6 +57,42 @@ def create_access_token(
 
 
 def decode_access_token(token: str, security: SecuritySettings | None = None) -> Dict[str, Any]:
+    """Verify ``token`` and return its claims.
+
+    Clients send the same bearer on every request, so verified payloads are
+    cached until their ``exp`` claim and repeat lookups skip the signature check.
+    """
+    global _token_cache_secret
     settings = security or get_settings().security
-    return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    secret = hashlib.sha256(settings.secret_key.encode()).digest()
+    key = (hashlib.sha256(token.encode()).digest(), settings.algorithm)
+    now = time.time()
+    with _token_cache_lock:
+        if secret != _token_cache_secret:
+            _token_cache.clear()
+            _token_cache_secret = secret
+        cached = _token_cache.get(key)
+    if cached is not None:
+        payload, expires_at = cached
+        if expires_at > now:
+            return dict(payload)
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_SIZE:
+                _evict_tokens(now)
+            _token_cache[key] = (dict(payload), float(expires_at))
+    return payload
+
+
+def _evict_tokens(now: float) -> None:
+    """Drop expired entries, then the oldest ones if the cache is still full."""
+    for key in [key for key, (_, exp) in _token_cache.items() if exp <= now]:
+        del _token_cache[key]
+    while len(_token_cache) >= TOKEN_CACHE_SIZE:
+        del _token_cache[next(iter(_token_cache))]
 
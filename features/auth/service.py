@@ -21,7 +21,7 @@ from domain.auth.participant import (
     ParticipantUpdate,
 )
 from app.settings import AppSettings, get_settings
-from features.auth.security import create_access_token, hash_password, verify_password
+from features.auth.security import create_access_token, hash_password_async, verify_password_async
 
 
 class AuthService:
@@ -29,9 +29,9 @@ class AuthService:
         self.settings = settings or get_settings()
 
     async def _admin_exists(self, session: AsyncSession) -> bool:
-        stmt = select(func.count(Admin.admin_id))
-        count = await session.scalar(stmt)
-        return bool(count and count > 0)
+        # Stop at the first row instead of counting the whole table.
+        stmt = select(Admin.admin_id).limit(1)
+        return await session.scalar(stmt) is not None
 
     async def bootstrap_admin(
         self, session: AsyncSession, payload: AuthSetupRequest
@@ -45,7 +45,7 @@ class AuthService:
         admin = Admin(
             admin_id=str(uuid4()),
             email=payload.email.lower(),
-            hashed_password=hash_password(payload.password),
+            hashed_password=await hash_password_async(payload.password),
             display_name=payload.display_name,
         )
         session.add(admin)
@@ -71,7 +71,7 @@ class AuthService:
     async def authenticate(self, session: AsyncSession, payload: LoginRequest) -> TokenResponse:
         stmt = select(Admin).where(func.lower(Admin.email) == payload.email.lower())
         admin = await session.scalar(stmt)
-        if not admin or not verify_password(payload.password, admin.hashed_password):
+        if not admin or not await verify_password_async(payload.password, admin.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials.",
@@ -100,7 +100,8 @@ class AuthService:
         admin_id: str,
         default_role: str = "viewer",
     ) -> list[ParticipantRead]:
-        created: list[ParticipantRead] = []
+        rows: list[Participant] = []
+        links: list[AdminParticipantLink] = []
         for payload in participants:
             participant = Participant(
                 participant_id=str(uuid4()),
@@ -110,15 +111,19 @@ class AuthService:
                 preferences_json=payload.preferences_json,
                 role=payload.role or default_role,
             )
-            session.add(participant)
-            link = AdminParticipantLink(
-                admin_id=admin_id,
-                participant_id=participant.participant_id,
-                role=payload.role or default_role,
+            rows.append(participant)
+            links.append(
+                AdminParticipantLink(
+                    admin_id=admin_id,
+                    participant_id=participant.participant_id,
+                    role=payload.role or default_role,
+                )
             )
-            session.add(link)
-            created.append(ParticipantRead.model_validate(participant))
-        return created
+        # Ids are generated client-side, so the commit flushes one batched INSERT per
+        # table and the response is built without reading the rows back.
+        session.add_all(rows)
+        session.add_all(links)
+        return [ParticipantRead.model_validate(participant) for participant in rows]
 
     async def create_participant(
         self, session: AsyncSession, payload: ParticipantCreate, admin_id: str
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from fastapi import Depends
-
 from api.catalog.internetarchive.movie import (
     MovieAssetBundle,
     MovieAssetPlan,
@@ -76,7 +74,11 @@ class MovieCatalogDownloadService:
         )
 
 
-def get_movie_catalog_download_service(
-    settings: AppSettings = Depends(get_settings),
-) -> MovieCatalogDownloadService:
-    return MovieCatalogDownloadService(settings)
+_movie_catalog_download_service: MovieCatalogDownloadService | None = None
+
+
+def get_movie_catalog_download_service() -> MovieCatalogDownloadService:
+    global _movie_catalog_download_service
+    if _movie_catalog_download_service is None:
+        _movie_catalog_download_service = MovieCatalogDownloadService(get_settings())
+    return _movie_catalog_download_service
@@ -52,9 +52,12 @@ async def ingest_catalog_movie(
     metadata: Mapping[str, object],
 ) -> MovieIngestResult:
     metadata_dict = dict(metadata)
-    video_path = video_path.expanduser().resolve()
-    if not video_path.exists():
-        raise FileNotFoundError(f"Video not found at {video_path}")
+    try:
+        # strict realpath already lstat()s every component, so it doubles as the
+        # existence check.
+        video_path = Path(os.path.realpath(os.path.expanduser(video_path), strict=True))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Video not found at {video_path}") from None
 
     file_hash = blake3_file(video_path)
 
@@ -91,7 +94,7 @@ async def ingest_catalog_movie(
     if not text_blob:
         text_blob = video_path.stem.replace("_", " ")
 
-    embedding = _text_embedding_service.encode(text_blob)
+    embedding = await _text_embedding_service.encode_async(text_blob)
 
     embedding_result = await session.execute(
         select(Movie).where(Movie.embedding_hash == embedding.vector_hash)
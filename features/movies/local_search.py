@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from typing import Callable, Sequence
 
 import numpy as np
-from fastapi import Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -138,7 +137,11 @@ class MovieLocalSearchService:
         return unique
 
 
-def get_movie_local_search_service(
-    settings: AppSettings = Depends(get_settings),
-) -> MovieLocalSearchService:
-    return MovieLocalSearchService(settings=settings)
+_movie_local_search_service: MovieLocalSearchService | None = None
+
+
+def get_movie_local_search_service() -> MovieLocalSearchService:
+    global _movie_local_search_service
+    if _movie_local_search_service is None:
+        _movie_local_search_service = MovieLocalSearchService(settings=get_settings())
+    return _movie_local_search_service
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from pathlib import Path
 import mimetypes
+import os
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
-from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.responses import FileRangeResponse
 from db.models import Movie
 from db.session import get_session
 from domain.catalog import CatalogDownloadRequest, CatalogDownloadResponse, CatalogMatchResponse
@@ -71,7 +72,7 @@ async def _fetch_all_movies(session: AsyncSession) -> list[MovieMedia]:
     return [movie_to_media(movie) for movie in movies]
 
 
-@router.get("/all", response_model=list[MovieMedia])
+@router.get("/all", response_model=list[MovieMedia], response_model_exclude_none=True)
 async def list_all_movies(session: AsyncSession = Depends(get_session)) -> list[MovieMedia]:
     return await _fetch_all_movies(session)
 
@@ -124,18 +125,6 @@ def _parse_range(range_header: str | None, file_size: int) -> tuple[int, int]:
     return start, end
 
 
-def _iter_file(path: Path, start: int, end: int, chunk_size: int = 1024 * 1024):
-    with path.open("rb") as file_obj:
-        file_obj.seek(start)
-        remaining = end - start + 1
-        while remaining > 0:
-            chunk = file_obj.read(min(chunk_size, remaining))
-            if not chunk:
-                break
-            remaining -= len(chunk)
-            yield chunk
-
-
 @router.get("/stream")
 async def stream_movie(
     file_hash: str,
@@ -151,10 +140,11 @@ async def stream_movie(
         raise HTTPException(status_code=404, detail="Movie file path unknown")
 
     file_path = Path(movie.path)
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Movie file not found on disk")
+    try:
+        file_size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Movie file not found on disk") from None
 
-    file_size = file_path.stat().st_size
     if file_size == 0:
         raise HTTPException(status_code=404, detail="Movie file is empty")
 
@@ -168,8 +158,10 @@ async def stream_movie(
         headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
 
     media_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
-    return StreamingResponse(
-        _iter_file(file_path, start, end),
+    return FileRangeResponse(
+        file_path,
+        start,
+        end,
         media_type=media_type,
         status_code=status_code,
         headers=headers,
@@ -3,11 +3,9 @@ from __future__ import annotations
 from typing import Callable, Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import Depends
-
 from app.settings import AppSettings, get_settings
 from api.catalog.internetarchive.movie import MovieCatalogClient
-from api.metadata.tmdb.client import TMDbClient
+from api.metadata.tmdb.client import TMDbClient, get_tmdb_client
 from domain.catalog import CatalogMatch, CatalogMatchCandidate, CatalogMatchResponse
 from domain.media.movies import MovieMedia
 
@@ -49,22 +47,17 @@ class MovieCatalogSearchService:
         if not (self.settings.tmdb.api_key or self.settings.tmdb.access_token):
             raise RuntimeError("TMDb credentials are required for catalog matching")
 
-        tmdb_client = (
-            self._tmdb_client_factory()
-            if self._tmdb_client_factory is not None
-            else TMDbClient()
-        )
-
-        try:
-            tmdb_movies = await tmdb_client.search_movie(
-                query,
-                limit=limit,
-                year=year,
-                include_adult=self.settings.tmdb.include_adult,
-                language=self.settings.tmdb.language,
+        if self._tmdb_client_factory is not None:
+            tmdb_client = self._tmdb_client_factory()
+            try:
+                tmdb_movies = await self._search_tmdb(tmdb_client, query, limit, year)
+            finally:
+                await tmdb_client.close()
+        else:
+            tmdb_client = get_tmdb_client(
+                self.settings.tmdb.api_key, self.settings.tmdb.access_token
             )
-        finally:
-            await tmdb_client.close()
+            tmdb_movies = await self._search_tmdb(tmdb_client, query, limit, year)
 
         ia_movies = self.ia_client.search_movies(
             query,
@@ -101,6 +94,21 @@ class MovieCatalogSearchService:
 
         return CatalogMatchResponse(matches=matches, total=len(matches))
 
+    async def _search_tmdb(
+        self,
+        tmdb_client: TMDbClient,
+        query: str,
+        limit: int,
+        year: Optional[int],
+    ) -> List[MovieMedia]:
+        return await tmdb_client.search_movie(
+            query,
+            limit=limit,
+            year=year,
+            include_adult=self.settings.tmdb.include_adult,
+            language=self.settings.tmdb.language,
+        )
+
     def _match_candidates(
         self,
         tmdb_movie: MovieMedia,
@@ -141,7 +149,11 @@ class MovieCatalogSearchService:
             return 0
 
 
-def get_movie_catalog_search_service(
-    settings: AppSettings = Depends(get_settings),
-) -> MovieCatalogSearchService:
-    return MovieCatalogSearchService(settings)
+_movie_catalog_search_service: MovieCatalogSearchService | None = None
+
+
+def get_movie_catalog_search_service() -> MovieCatalogSearchService:
+    global _movie_catalog_search_service
+    if _movie_catalog_search_service is None:
+        _movie_catalog_search_service = MovieCatalogSearchService(get_settings())
+    return _movie_catalog_search_service
@@ -6,12 +6,12 @@ import shutil
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
-from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.catalog.jamendo import get_jamendo_client
+from app.responses import FileRangeResponse
 from app.settings import get_settings
 from db.models import MusicTrack
 from db.session import get_session
@@ -20,7 +20,7 @@ from features.music import vector_index
 from features.music.utils import (
     apply_media_to_track,
     ensure_duration_seconds,
-    track_to_media,
+    tracks_to_media,
 )
 from infrastructure.embedding.sentence_bert_service import get_sentence_bert_service
 from utils.hashing import blake3_file
@@ -92,13 +92,17 @@ async def download_catalog_music(
     )
 
 
-@router.get("/all", response_model=list[MusicTrackMedia])
+@router.get("/all", response_model=list[MusicTrackMedia], response_model_exclude_none=True)
 async def list_all_music(session: AsyncSession = Depends(get_session)) -> list[MusicTrackMedia]:
     result = await session.scalars(select(MusicTrack).order_by(MusicTrack.title))
-    return [track_to_media(row) for row in result]
+    return tracks_to_media(result.all())
 
 
-@router.get("/local/search", response_model=list[MusicTrackMedia])
+@router.get(
+    "/local/search",
+    response_model=list[MusicTrackMedia],
+    response_model_exclude_none=True,
+)
 async def search_local_music(
     query: str = Query(..., min_length=1, description="Search local library"),
     limit: int = Query(20, ge=1, le=50),
@@ -118,7 +122,7 @@ async def search_local_music(
         .limit(limit)
     )
     result = await session.scalars(stmt)
-    return [track_to_media(row) for row in result]
+    return tracks_to_media(result.all())
 
 
 @router.get("/stream")
@@ -126,16 +130,17 @@ async def stream_music(
     file_hash: str = Query(..., description="BLAKE3 hash of the stored track"),
     range_header: str | None = Header(None, alias="Range"),
     session: AsyncSession = Depends(get_session),
-) -> StreamingResponse:
+) -> FileRangeResponse:
     track = await session.scalar(select(MusicTrack).where(MusicTrack.file_hash == file_hash))
     if track is None or not track.path:
         raise HTTPException(status_code=404, detail="Track not found")
 
     file_path = Path(track.path)
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Track file missing on disk")
+    try:
+        file_size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Track file missing on disk") from None
 
-    file_size = file_path.stat().st_size
     if file_size == 0:
         raise HTTPException(status_code=404, detail="Track file is empty")
 
@@ -148,8 +153,10 @@ async def stream_music(
         headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
 
     media_type = mimetypes.guess_type(file_path.name)[0] or "audio/mpeg"
-    return StreamingResponse(
-        _iter_file(file_path, start, end),
+    return FileRangeResponse(
+        file_path,
+        start,
+        end,
         media_type=media_type,
         status_code=status_code,
         headers=headers,
@@ -166,7 +173,7 @@ async def _persist_track(
     stored_path = _store_track_on_raid(downloaded_path, file_hash)
 
     text_blob = _build_embedding_corpus(media)
-    embedding = _embedding_service.encode(text_blob)
+    embedding = await _embedding_service.encode_async(text_blob)
     media.embedding_hash = embedding.vector_hash
     vector_index.append(embedding.vector)
 
@@ -249,18 +256,6 @@ def _parse_range(range_header: str | None, file_size: int) -> tuple[int, int]:
     return start, end
 
 
-def _iter_file(path: Path, start: int, end: int, chunk_size: int = 1024 * 1024):
-    with path.open("rb") as file_obj:
-        file_obj.seek(start)
-        remaining = end - start + 1
-        while remaining > 0:
-            chunk = file_obj.read(min(chunk_size, remaining))
-            if not chunk:
-                break
-            remaining -= len(chunk)
-            yield chunk
-
-
 def _build_embedding_corpus(media: MusicTrackMedia) -> str:
     parts: list[str] = []
     parts.append(media.title or "")
@@ -4,14 +4,18 @@ import json
 import logging
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
+
+from pydantic import TypeAdapter
 
 from db.models import MusicTrack
-from domain.media.base import ImageMetadata
 from domain.media.music import MusicTrackMedia
+from utils.serialization import json_loads
 
 logger = logging.getLogger(__name__)
 
+_TRACK_LIST_ADAPTER = TypeAdapter(list[MusicTrackMedia])
+
 
 def _probe_duration_seconds(file_path: Path) -> Optional[int]:
     """Use ffprobe to determine audio duration in seconds."""
@@ -31,7 +35,6 @@ def _probe_duration_seconds(file_path: Path) -> Optional[int]:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             check=True,
         )
     except FileNotFoundError:
@@ -42,7 +45,7 @@ def _probe_duration_seconds(file_path: Path) -> Optional[int]:
         return None
 
     try:
-        payload = json.loads(result.stdout)
+        payload = json_loads(result.stdout)
         duration_raw = payload["format"]["duration"]
         duration = float(duration_raw)
         return int(round(duration))
@@ -60,36 +63,21 @@ def ensure_duration_seconds(file_path: Optional[Path], current: Optional[int]) -
 
 
 def track_to_media(model: MusicTrack) -> MusicTrackMedia:
-    poster = ImageMetadata(**model.poster) if model.poster else None
-    backdrop = ImageMetadata(**model.backdrop) if model.backdrop else None
-
-    duration = ensure_duration_seconds(Path(model.path) if model.path else None, model.duration_s)
-
-    return MusicTrackMedia(
-        title=model.title,
-        track_id=model.track_id,
-        artist=model.artist,
-        artist_id=model.artist_id,
-        album=model.album,
-        album_id=model.album_id,
-        track_number=model.track_number,
-        duration_s=duration,
-        release_year=model.release_year,
-        genres=model.genres,
-        license=model.license,
-        audio_url=model.audio_url,
-        downloads=model.downloads,
-        likes=model.likes,
-        file_hash=model.file_hash,
-        embedding_hash=model.embedding_hash,
-        path=model.path,
-        format=model.format,
-        media_type=model.media_type,
-        catalog_source=model.catalog_source,
-        catalog_id=model.catalog_id,
-        poster=poster,
-        backdrop=backdrop,
-    )
+    # Field names mirror the columns, so pydantic-core reads the row directly.
+    media = MusicTrackMedia.model_validate(model, from_attributes=True)
+    if media.duration_s is None and model.path:
+        media.duration_s = ensure_duration_seconds(Path(model.path), None)
+    return media
+
+
+def tracks_to_media(models: Sequence[MusicTrack]) -> list[MusicTrackMedia]:
+    """Batch form of :func:`track_to_media`, validating every row in one call."""
+
+    tracks = _TRACK_LIST_ADAPTER.validate_python(models, from_attributes=True)
+    for media in tracks:
+        if media.duration_s is None and media.path:
+            media.duration_s = ensure_duration_seconds(Path(media.path), None)
+    return tracks
 
 
 def apply_media_to_track(
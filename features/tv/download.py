@@ -151,5 +151,11 @@ class TvCatalogDownloadService:
         return metadata
 
 
+_tv_catalog_download_service: TvCatalogDownloadService | None = None
+
+
 def get_tv_catalog_download_service() -> TvCatalogDownloadService:
-    return TvCatalogDownloadService()
+    global _tv_catalog_download_service
+    if _tv_catalog_download_service is None:
+        _tv_catalog_download_service = TvCatalogDownloadService()
+    return _tv_catalog_download_service
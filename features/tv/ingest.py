@@ -64,9 +64,12 @@ async def ingest_catalog_tv(
     metadata: Mapping[str, object],
 ) -> TvIngestResult:
     metadata_dict = dict(metadata)
-    video_path = video_path.expanduser().resolve()
-    if not video_path.exists():
-        raise FileNotFoundError(f"Video not found at {video_path}")
+    try:
+        # strict realpath already lstat()s every component, so it doubles as the
+        # existence check.
+        video_path = Path(os.path.realpath(os.path.expanduser(video_path), strict=True))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Video not found at {video_path}") from None
 
     file_hash = blake3_file(video_path)
 
@@ -97,7 +100,7 @@ async def ingest_catalog_tv(
     text_components = [episode_name, episode_overview, series_name, series_overview]
     text_blob = " ".join(filter(None, text_components)).strip() or video_path.stem.replace("_", " ")
 
-    embedding = _embedding_service.encode(text_blob)
+    embedding = await _embedding_service.encode_async(text_blob)
 
     duplicate_episode = (
         await session.execute(select(TvEpisode).where(TvEpisode.embedding_hash == embedding.vector_hash))
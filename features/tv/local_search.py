@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from typing import Callable, Sequence
 
 import numpy as np
-from fastapi import Depends
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -185,7 +184,11 @@ class TvLocalSearchService:
         )
 
 
-def get_tv_local_search_service(
-    settings: AppSettings = Depends(get_settings),
-) -> TvLocalSearchService:
-    return TvLocalSearchService(settings=settings)
+_tv_local_search_service: TvLocalSearchService | None = None
+
+
+def get_tv_local_search_service() -> TvLocalSearchService:
+    global _tv_local_search_service
+    if _tv_local_search_service is None:
+        _tv_local_search_service = TvLocalSearchService(settings=get_settings())
+    return _tv_local_search_service
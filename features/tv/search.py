@@ -5,12 +5,11 @@ from datetime import datetime
 from typing import Callable, Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import Depends
 from pydantic import BaseModel, Field
 
 from app.settings import AppSettings, get_settings
 from api.catalog.internetarchive.tv import TvCatalogClient
-from api.metadata.tmdb.client import TMDbClient, TMDbTvSearchResult
+from api.metadata.tmdb.client import TMDbClient, TMDbTvSearchResult, get_tmdb_client
 from domain.media.tv import TvEpisodeMetadata
 
 
@@ -94,7 +93,7 @@ def _extract_year(date_value: Optional[datetime]) -> Optional[int]:
 class TvCatalogSearchService:
     settings: AppSettings
     ia_client: TvCatalogClient
-    tmdb_client_factory: Callable[[], TMDbClient]
+    tmdb_client_factory: Callable[[], TMDbClient] | None
 
     def __init__(
         self,
@@ -104,7 +103,7 @@ class TvCatalogSearchService:
     ) -> None:
         self.settings = settings
         self.ia_client = ia_client or TvCatalogClient()
-        self.tmdb_client_factory = tmdb_client_factory or TMDbClient
+        self.tmdb_client_factory = tmdb_client_factory
 
     async def search(
         self,
@@ -116,15 +115,26 @@ class TvCatalogSearchService:
         if not (self.settings.tmdb.api_key or self.settings.tmdb.access_token):
             raise RuntimeError("TMDb credentials are required for catalog matching")
 
-        tmdb_client = self.tmdb_client_factory()
-        try:
+        if self.tmdb_client_factory is not None:
+            tmdb_client = self.tmdb_client_factory()
+            try:
+                tmdb_results = await tmdb_client.search_tv(
+                    query,
+                    language=self.settings.tmdb.language,
+                    include_adult=self.settings.tmdb.include_adult,
+                )
+            finally:
+                await tmdb_client.close()
+        else:
+            # The shared client keeps its connection pool open across searches.
+            tmdb_client = get_tmdb_client(
+                self.settings.tmdb.api_key, self.settings.tmdb.access_token
+            )
             tmdb_results = await tmdb_client.search_tv(
                 query,
                 language=self.settings.tmdb.language,
                 include_adult=self.settings.tmdb.include_adult,
             )
-        finally:
-            await tmdb_client.close()
 
         tmdb_metadata = [_search_result_to_metadata(result) for result in tmdb_results]
         if year is not None:
@@ -199,7 +209,11 @@ class TvCatalogSearchService:
         return candidates
 
 
-def get_tv_catalog_search_service(
-    settings: AppSettings = Depends(get_settings),
-) -> TvCatalogSearchService:
-    return TvCatalogSearchService(settings=settings)
+_tv_catalog_search_service: TvCatalogSearchService | None = None
+
+
+def get_tv_catalog_search_service() -> TvCatalogSearchService:
+    global _tv_catalog_search_service
+    if _tv_catalog_search_service is None:
+        _tv_catalog_search_service = TvCatalogSearchService(settings=get_settings())
+    return _tv_catalog_search_service
@@ -9,6 +9,13 @@ import diskannpy as dap
 import numpy as np
 
 
+def _as_float32_contiguous(array: np.ndarray) -> np.ndarray:
+    """Return ``array`` itself when it is already C-contiguous float32."""
+    if isinstance(array, np.ndarray) and array.dtype == np.float32 and array.flags.c_contiguous:
+        return array
+    return np.ascontiguousarray(array, dtype=np.float32)
+
+
 class DiskAnnIndex:
     def __init__(
         self,
@@ -30,6 +37,10 @@ class DiskAnnIndex:
         self.num_threads = num_threads or os.cpu_count() or 4
         self._static_index: Optional[dap.StaticDiskIndex] = None
 
+    @property
+    def is_loaded(self) -> bool:
+        return self._static_index is not None
+
     def _has_index(self) -> bool:
         if not self.index_directory.exists():
             return False
@@ -46,25 +57,33 @@ class DiskAnnIndex:
             self.clear()
             return
 
-        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        source = vectors
+        vectors = _as_float32_contiguous(vectors)
         if vectors.ndim != 2 or vectors.shape[1] != self.dim:
             raise ValueError(
                 f"Expected vectors with shape (N, {self.dim}), got {vectors.shape}"
             )
 
-        if self.index_directory.exists():
-            shutil.rmtree(self.index_directory)
-        self.index_directory.mkdir(parents=True, exist_ok=True)
+        # Build next to the live index and swap directories once complete, so
+        # searches keep hitting the previous index for the whole build.
+        staging = self.index_directory.with_name(f"{self.index_directory.name}.building")
+        if staging.exists():
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True)
 
         if self.metric == "cosine":
-            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-            safe_norms = np.where(norms == 0.0, 1.0, norms)
-            vectors = vectors / safe_norms
+            norms = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))[:, None]
+            norms[norms == 0.0] = 1.0
+            if vectors is source or not vectors.flags.writeable:
+                vectors = vectors / norms
+            else:
+                # Already a private copy: normalise in place.
+                vectors /= norms
 
         dap.build_disk_index(
             data=vectors,
             distance_metric=self._dap_metric,
-            index_directory=str(self.index_directory),
+            index_directory=str(staging),
             complexity=self.complexity,
             graph_degree=self.graph_degree,
             search_memory_maximum=self.search_memory_budget,
@@ -73,6 +92,13 @@ class DiskAnnIndex:
             vector_dtype=np.float32,
         )
 
+        retired = self.index_directory.with_name(f"{self.index_directory.name}.old")
+        if retired.exists():
+            shutil.rmtree(retired)
+        if self.index_directory.exists():
+            os.replace(self.index_directory, retired)
+        os.replace(staging, self.index_directory)
+
         self._static_index = dap.StaticDiskIndex(
             index_directory=str(self.index_directory),
             num_threads=self.num_threads,
@@ -80,6 +106,7 @@ class DiskAnnIndex:
             distance_metric=self._dap_metric,
             vector_dtype=np.float32,
         )
+        shutil.rmtree(retired, ignore_errors=True)
 
     def load(self) -> None:
         if not self._has_index():
@@ -98,7 +125,7 @@ class DiskAnnIndex:
         if self._static_index is None:
             return np.empty((0,), dtype=np.int64), np.empty((0,), dtype=np.float32)
 
-        query = np.asarray(query, dtype=np.float32)
+        query = _as_float32_contiguous(query)
         if query.ndim != 1 or query.shape[0] != self.dim:
             raise ValueError(f"Query must be 1D of length {self.dim}, got {query.shape}")
 
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def cosine_scores(vectors: np.ndarray, q: np.ndarray, out: np.ndarray) -> None:
+    """Write the cosine of each row of ``vectors`` with unit ``q`` into ``out``.
+
+    Zero rows score their raw dot product (0.0) instead of dividing by zero.
+    """
+    np.dot(vectors, q, out=out)
+    norms = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+    norms[norms == 0.0] = 1.0
+    out /= norms
+
+
+def l2_scores(vectors: np.ndarray, q: np.ndarray, out: np.ndarray) -> None:
+    """Write the squared Euclidean distance of each row of ``vectors`` to ``q`` into ``out``."""
+    # ||v - q||^2 = ||v||^2 - 2 v.q + ||q||^2, without an (N, dim) difference array.
+    np.dot(vectors, q, out=out)
+    out *= -2.0
+    out += np.einsum("ij,ij->i", vectors, vectors)
+    out += np.dot(q, q)
+    np.maximum(out, 0.0, out=out)
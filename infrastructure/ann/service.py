@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass
 from typing import Sequence
 
@@ -7,13 +9,15 @@ import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.ann.diskann import DiskAnnIndex
+from infrastructure.ann.diskann import DiskAnnIndex, _as_float32_contiguous
 from infrastructure.ann.vector_store import VectorStore
 from db.models import IdMap
 from app.settings import AppSettings, get_settings
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class AnnResult:
     row_id: int
     score: float
@@ -21,6 +25,9 @@ class AnnResult:
     media_id: str | None = None
 
 
+_WARMUP_STRIDE_BYTES = 64 * 1024 * 1024
+
+
 class AnnService:
     def __init__(self, settings: AppSettings | None = None) -> None:
         self.settings = settings or get_settings()
@@ -37,7 +44,11 @@ class AnnService:
             num_threads=self.settings.ann.num_threads,
         )
         self.rebuild_batch = max(1, self.settings.ann.rebuild_batch)
-        self._pending_rebuild = False
+        self.rebuild_interval_s = self.settings.ann.rebuild_interval_s
+        self._dirty_rows = 0
+        self._rebuild_lock = asyncio.Lock()
+        self._rebuild_task: asyncio.Task[None] | None = None
+        self._flush_loop_task: asyncio.Task[None] | None = None
         self._bootstrap_index()
 
     def _bootstrap_index(self) -> None:
@@ -48,6 +59,19 @@ class AnnService:
         vectors = self.vector_store.read_all()
         self.index.build(vectors)
 
+    def warmup(self) -> None:
+        """Fault the vector file and index pages in before the first query."""
+        if self.vector_store.row_count() == 0:
+            return
+        buffer = bytearray(_WARMUP_STRIDE_BYTES)
+        with self.vector_store.path.open("rb", buffering=0) as handle:
+            while handle.readinto(buffer):
+                pass
+
+        probe = np.zeros(self.settings.embedding.dim, dtype=np.float32)
+        probe[0] = 1.0
+        self.index.search(probe, 1)
+
     async def add_embedding(
         self,
         session: AsyncSession,
@@ -55,33 +79,77 @@ class AnnService:
         vector_hash: str,
         vector: np.ndarray,
     ) -> int:
-        vec = np.asarray(vector, dtype=np.float32)
+        vec = _as_float32_contiguous(vector)
         row_id = self.vector_store.append(vec)
         session.add(IdMap(row_id=row_id, vector_hash=vector_hash, media_id=media_id))
         await session.flush()
 
-        if self.vector_store.row_count() % self.rebuild_batch == 0:
-            vectors = self.vector_store.read_all()
-            self.index.build(vectors)
-            self._pending_rebuild = False
-        else:
-            self._pending_rebuild = True
+        # Rebuilding the DiskANN index rewrites it from scratch, so inserts only
+        # mark it dirty; rebuilds run in a worker thread once ``rebuild_batch``
+        # rows are pending, or from the periodic flush loop.
+        self._dirty_rows += 1
+        if self._dirty_rows >= self.rebuild_batch and (
+            self._rebuild_task is None or self._rebuild_task.done()
+        ):
+            self._rebuild_task = asyncio.get_running_loop().create_task(
+                self._flush_in_background()
+            )
         return row_id
 
-    def search(self, query_vector: np.ndarray, k: int) -> list[AnnResult]:
-        if self._pending_rebuild:
-            vectors = self.vector_store.read_all()
-            self.index.build(vectors)
-            self._pending_rebuild = False
+    def _rebuild(self) -> None:
+        # Other workers may append to the same file; rebuild from all of it.
+        self.vector_store.refresh()
+        vectors = self.vector_store.read_all()
+        self.index.build(vectors)
 
-        if self.vector_store.row_count() == 0:
+    async def flush(self) -> None:
+        """Rebuild the index off the event loop if any rows are pending."""
+        async with self._rebuild_lock:
+            pending = self._dirty_rows
+            if pending == 0:
+                return
+            await asyncio.to_thread(self._rebuild)
+            # Rows appended while the build ran stay pending for the next flush.
+            self._dirty_rows -= pending
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("ANN index rebuild failed: %s", exc, exc_info=True)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.rebuild_interval_s)
+            await self._flush_in_background()
+
+    def start(self) -> None:
+        """Start the periodic background flush."""
+        if self._flush_loop_task is None or self._flush_loop_task.done():
+            self._flush_loop_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the background flush and persist any pending rows."""
+        if self._flush_loop_task is not None:
+            self._flush_loop_task.cancel()
+            try:
+                await self._flush_loop_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_loop_task = None
+        await self.flush()
+
+    def search(self, query_vector: np.ndarray, k: int) -> list[AnnResult]:
+        # Short-circuit before touching the query or the vector file: the index
+        # answers from its own graph, so an empty index means no results.
+        if k <= 0 or not self.index.is_loaded:
             return []
-        q = np.asarray(query_vector, dtype=np.float32)
+        q = np.array(query_vector, dtype=np.float32)
         if q.ndim > 1:
             q = q[0]
         norm = np.linalg.norm(q)
         if norm > 0:
-            q = q / norm
+            q /= norm
 
         indices, distances = self.index.search(q, k)
         if indices.size == 0:
@@ -92,34 +160,25 @@ class AnnService:
         else:
             scores = -distances
 
-        results: list[AnnResult] = []
-        for idx, score in zip(indices, scores):
-            if idx < 0:
-                continue
-            results.append(AnnResult(row_id=int(idx), score=float(score)))
-        return results[:k]
+        valid = indices >= 0
+        return [
+            AnnResult(row_id=row_id, score=score)
+            for row_id, score in zip(indices[valid][:k].tolist(), scores[valid][:k].tolist())
+        ]
 
     async def resolve_media(
         self, session: AsyncSession, results: Sequence[AnnResult]
     ) -> list[AnnResult]:
         if not results:
             return []
-        row_ids = [res.row_id for res in results]
+        row_ids = tuple(res.row_id for res in results)
         stmt = select(IdMap.row_id, IdMap.vector_hash, IdMap.media_id).where(IdMap.row_id.in_(row_ids))
         rows = await session.execute(stmt)
         mapping = {row_id: (vector_hash, media_id) for row_id, vector_hash, media_id in rows.all()}
-        resolved: list[AnnResult] = []
+        # Fill in the existing results rather than allocating a second set.
         for res in results:
-            vector_hash, media_id = mapping.get(res.row_id, (None, None))
-            resolved.append(
-                AnnResult(
-                    row_id=res.row_id,
-                    score=res.score,
-                    vector_hash=vector_hash,
-                    media_id=media_id,
-                )
-            )
-        return resolved
+            res.vector_hash, res.media_id = mapping.get(res.row_id, (None, None))
+        return list(results)
 
 
 _ann_service: AnnService | None = None
@@ -1,49 +1,308 @@
 from __future__ import annotations
 
+import mmap
 import os
 from pathlib import Path
-from typing import Sequence
+from typing import Sequence, Tuple
 
 import numpy as np
 
+from infrastructure.ann.kernels import cosine_scores, l2_scores
+
+
+_SCAN_BLOCK_ROWS = 8192
+
+
+def _advise(mm: np.memmap, name: str, start: int = 0, length: int = 0) -> None:
+    """Pass an ``madvise`` hint for ``mm`` where the platform supports it.
+
+    ``start`` and ``length`` are byte offsets into the mapping; a zero length
+    covers the whole mapping.
+    """
+    advice = getattr(mmap, name, None)
+    if advice is None or mm._mmap is None:
+        return
+    if length:
+        aligned = start - start % mmap.PAGESIZE
+        mm._mmap.madvise(advice, aligned, length + start - aligned)
+    else:
+        mm._mmap.madvise(advice)
+
 
 class VectorStore:
-    def __init__(self, path: Path, dim: int) -> None:
+    """Append-only file of fixed-width float32 vectors.
+
+    With ``bypass_page_cache`` each batch is flushed to disk and then dropped
+    from the page cache, so bulk ingest neither builds up dirty pages nor
+    evicts pages that queries are using.
+    """
+
+    def __init__(self, path: Path, dim: int, *, bypass_page_cache: bool = False) -> None:
         self.path = path
         self.dim = dim
-        self.dtype = np.float32
-        self.record_bytes = dim * np.dtype(self.dtype).itemsize
+        self.bypass_page_cache = bypass_page_cache and hasattr(os, "posix_fadvise")
+        # One record per row; numpy expands the sub-array dtype so arrays of
+        # records are plain (rows, dim) float32 matrices.
+        self.record_dtype = self._make_record_dtype(dim)
+        self.record_bytes = self.record_dtype.itemsize
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if not self.path.exists():
             self.path.touch()
+        self._mm: np.memmap | None = None
+        self._fd: int | None = None
+        self._read_fd: int | None = None
+        self._size = 0
+        self.refresh()
+
+    @staticmethod
+    def _make_record_dtype(dim: int) -> np.dtype:
+        return np.dtype((np.float32, (dim,)))
+
+    def _encode(self, batch: np.ndarray) -> np.ndarray:
+        """Turn a contiguous ``(n, dim)`` float32 batch into on-disk records."""
+        return batch
+
+    def _decode(self, records: np.ndarray) -> np.ndarray:
+        """Turn records back into a ``(n, dim)`` float32 matrix."""
+        return records
+
+    def refresh(self) -> None:
+        """Re-read the file size, picking up rows written by other stores or processes.
+
+        ``row_count`` is served from this cached size, which our own appends
+        keep current without a ``stat`` per call. Whole-file scans refresh it
+        first, so searches see rows appended by other workers.
+        """
+        self._size = self.path.stat().st_size
+
+    def close(self) -> None:
+        """Release the cached file descriptors."""
+        for name in ("_fd", "_read_fd"):
+            fd = getattr(self, name, None)
+            if fd is not None:
+                os.close(fd)
+                setattr(self, name, None)
+
+    def __del__(self) -> None:
+        self.close()
+
+    @staticmethod
+    def _write_all(fd: int, data: np.ndarray) -> int:
+        """Write a contiguous array without copying it; return the new file end."""
+        view = memoryview(data).cast("B")
+        while view:
+            view = view[os.write(fd, view) :]
+        return os.lseek(fd, 0, os.SEEK_CUR)
 
     def row_count(self) -> int:
-        size = self.path.stat().st_size
-        if size == 0:
-            return 0
-        return size // self.record_bytes
+        return self._size // self.record_bytes
+
+    def _mapped(self) -> np.ndarray:
+        """Return a read-only memmap of every record, remapping after growth."""
+        self.refresh()
+        count = self.row_count()
+        if count == 0:
+            self._mm = None
+            return np.empty((0,), dtype=self.record_dtype)
+        if self._mm is None or self._mm.shape[0] != count:
+            self._mm = np.memmap(self.path, dtype=self.record_dtype, mode="r", shape=(count,))
+            # The mapping only serves whole-file scans; sparse reads use pread.
+            _advise(self._mm, "MADV_SEQUENTIAL")
+        return self._mm
 
     def append(self, vector: np.ndarray) -> int:
-        vec = np.asarray(vector, dtype=self.dtype)
-        if vec.shape[-1] != self.dim:
-            raise ValueError(f"Vector dim mismatch: expected {self.dim}, got {vec.shape[-1]}")
-        with self.path.open("ab") as handle:
-            handle.write(np.ascontiguousarray(vec).astype(self.dtype).tobytes())
-        return self.row_count() - 1
+        return self.append_many(np.reshape(vector, (1, -1))).start
+
+    def append_many(self, vectors: np.ndarray) -> range:
+        """Append a ``(n, dim)`` batch with one write and return the new row ids."""
+        # At most one conversion: float32 input that is already C-contiguous is
+        # written straight from its own buffer.
+        batch = np.ascontiguousarray(vectors, dtype=np.float32)
+        if batch.ndim != 2 or batch.shape[1] != self.dim:
+            raise ValueError(f"Vector dim mismatch: expected {self.dim}, got {batch.shape[-1]}")
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # The append-mode offset is the new end of file, so no stat is needed.
+        self._size = self._write_all(self._fd, self._encode(batch))
+        written = batch.shape[0] * self.record_bytes
+        if self.bypass_page_cache:
+            os.fdatasync(self._fd)
+            os.posix_fadvise(self._fd, self._size - written, written, os.POSIX_FADV_DONTNEED)
+        end = self._size // self.record_bytes
+        return range(end - batch.shape[0], end)
 
     def read_rows(self, row_ids: Sequence[int]) -> np.ndarray:
-        if not row_ids:
-            return np.empty((0, self.dim), dtype=self.dtype)
-        count = self.row_count()
-        if count == 0:
-            return np.empty((0, self.dim), dtype=self.dtype)
-        mm = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(count, self.dim))
-        return np.array(mm[row_ids])
+        """Gather ``row_ids`` with one positioned read per row.
+
+        Only the requested records are read, in file order, so sparse lookups
+        never map the file or pull in readahead around unrelated rows.
+        """
+        idx = np.asarray(row_ids, dtype=np.int64)
+        out = np.empty(idx.shape[0], dtype=self.record_dtype)
+        if idx.shape[0] == 0:
+            return self._decode(out)
+        if self._read_fd is None:
+            self._read_fd = os.open(self.path, os.O_RDONLY)
+        rows = out.reshape(idx.shape[0], -1)
+        for i in np.argsort(idx, kind="stable").tolist():
+            row_id = int(idx[i])
+            read = os.preadv(self._read_fd, [rows[i]], row_id * self.record_bytes) if row_id >= 0 else 0
+            if read != self.record_bytes:
+                raise IndexError(f"Row {row_id} is out of range")
+        return self._decode(out)
 
     def read_all(self) -> np.ndarray:
-        count = self.row_count()
-        if count == 0:
-            return np.empty((0, self.dim), dtype=self.dtype)
-        mm = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(count, self.dim))
-        return np.array(mm)
+        """Return every row without copying the file into memory.
+
+        Float32 stores return the read-only memmap itself, so pages are only
+        faulted in as a consumer touches them; callers must not mutate it and
+        should use :meth:`copy_all` when they need a private array.
+        """
+        return self._decode(self._mapped())
+
+    def copy_all(self) -> np.ndarray:
+        """Return every row as a private, writable float32 array."""
+        vectors = self.read_all()
+        return np.array(vectors) if vectors is self._mm else vectors
+
+    def _tiles(self, stored: np.ndarray, block: int):
+        """Yield ``(start, float32 tile)`` pairs covering ``stored``."""
+        for start in range(0, stored.shape[0], block):
+            yield start, self._decode(stored[start : start + block])
+
+    def scan_l2(self, query: np.ndarray) -> np.ndarray:
+        """Squared Euclidean distance from ``query`` to every stored row, in row order."""
+        stored = self._mapped()
+        q = np.ascontiguousarray(query, dtype=np.float32).ravel()
+        dists = np.empty(stored.shape[0], dtype=np.float32)
+        for start, tile in self._tiles(stored, _SCAN_BLOCK_ROWS):
+            l2_scores(tile, q, dists[start : start + tile.shape[0]])
+        return dists
+
+    def scan_topk(
+        self, query: np.ndarray, k: int, block: int = 4096
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact squared-L2 top-``k`` (ids, distances), nearest first.
+
+        Rows are scanned in ``block``-row tiles so each tile is scored while it
+        is still cache resident, and only the ``k`` best of each tile are merged
+        into the running result instead of keeping a full distance array.
+        """
+        empty = np.empty((0,), dtype=np.int64), np.empty((0,), dtype=np.float32)
+        stored = self._mapped()
+        count = stored.shape[0]
+        if k <= 0 or count == 0:
+            return empty
+
+        q = np.ascontiguousarray(query, dtype=np.float32).ravel()
+        best_ids = empty[0]
+        best = empty[1]
+        dists = np.empty(min(block, count), dtype=np.float32)
+        for start, tile in self._tiles(stored, block):
+            stop = start + tile.shape[0]
+            if stop < count:
+                # Start paging the next tile in while this one is scored.
+                _advise(
+                    stored,
+                    "MADV_WILLNEED",
+                    stop * self.record_bytes,
+                    (min(stop + block, count) - stop) * self.record_bytes,
+                )
+            tile_dists = dists[: tile.shape[0]]
+            l2_scores(tile, q, tile_dists)
+            if tile_dists.shape[0] > k:
+                keep = np.argpartition(tile_dists, k)[:k]
+            else:
+                keep = np.arange(tile_dists.shape[0])
+            best_ids = np.concatenate((best_ids, keep + start))
+            best = np.concatenate((best, tile_dists[keep]))
+            if best.shape[0] > k:
+                keep = np.argpartition(best, k)[:k]
+                best_ids, best = best_ids[keep], best[keep]
+
+        order = np.argsort(best, kind="stable")
+        return best_ids[order].astype(np.int64), best[order]
+
+    def search_cosine(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact cosine top-``k`` over every stored row.
+
+        Runs directly on the memory-mapped file, so the store is never copied
+        into an intermediate array before scoring.
+        """
+        empty = np.empty((0,), dtype=np.int64), np.empty((0,), dtype=np.float32)
+        if k <= 0:
+            return empty
+
+        stored = self._mapped()
+        if stored.shape[0] == 0:
+            return empty
+
+        # Private copy so the query can be normalised in place.
+        q = np.array(query, dtype=np.float32).ravel()
+        q_norm = np.linalg.norm(q)
+        if q_norm == 0:
+            return empty
+        q /= q_norm
+
+        # Score raw rows and divide by the row norms afterwards. This is
+        # equivalent to normalising every row first but never materialises an
+        # (N, dim) temporary; small stores use a fused loop instead of BLAS.
+        sims = np.empty(stored.shape[0], dtype=np.float32)
+        for start, tile in self._tiles(stored, _SCAN_BLOCK_ROWS):
+            cosine_scores(tile, q, sims[start : start + tile.shape[0]])
+
+        # Select the k best in O(N) and only sort those, rather than sorting all N.
+        if k >= sims.shape[0]:
+            top = np.argsort(-sims)
+        else:
+            part = np.argpartition(-sims, k)[:k]
+            top = part[np.argsort(-sims[part])]
+        return top.astype(np.int64), sims[top].astype(np.float32)
+
+
+class QuantizedVectorStore(VectorStore):
+    """Vector store holding int8 codes with an inline per-vector scale and bias.
+
+    Each record is ``scale, bias`` (float32) followed by ``dim`` int8 codes, so
+    a vector costs ``dim + 8`` bytes instead of ``4 * dim`` and decodes as
+    ``codes * scale + bias``. Appends use a symmetric quantiser (``bias`` is 0).
+    """
+
+    @staticmethod
+    def _make_record_dtype(dim: int) -> np.dtype:
+        return np.dtype([("scale", "<f4"), ("bias", "<f4"), ("codes", "i1", (dim,))])
+
+    @staticmethod
+    def quantize(vector: np.ndarray) -> tuple[np.ndarray, np.float32]:
+        """Return symmetric int8 codes and the scale that maps them back to ``vector``."""
+        codes, scales = QuantizedVectorStore._quantize_rows(
+            np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        )
+        return codes[0], scales[0]
+
+    @staticmethod
+    def _quantize_rows(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        peaks = np.abs(matrix).max(axis=1) if matrix.size else np.zeros(matrix.shape[0], np.float32)
+        scales = np.where(peaks > 0.0, peaks / 127.0, 1.0).astype(np.float32)
+        codes = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+        return codes, scales
+
+    def _encode(self, batch: np.ndarray) -> np.ndarray:
+        records = np.empty(batch.shape[0], dtype=self.record_dtype)
+        records["codes"], records["scale"] = self._quantize_rows(batch)
+        records["bias"] = 0.0
+        return records
+
+    def _decode(self, records: np.ndarray) -> np.ndarray:
+        decoded = records["codes"].astype(np.float32)
+        decoded *= records["scale"][:, None]
+        decoded += records["bias"][:, None]
+        return decoded
+
 
+def open_vector_store(
+    path: Path, dim: int, vector_dtype: str = "float32", *, bypass_page_cache: bool = False
+) -> VectorStore:
+    """Return the store implementation for ``settings.ann.vector_dtype``."""
+    store_cls = QuantizedVectorStore if vector_dtype == "int8" else VectorStore
+    return store_cls(path, dim, bypass_page_cache=bypass_page_cache)
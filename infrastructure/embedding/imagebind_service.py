@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import logging
 import random
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Sequence
 
@@ -12,7 +15,19 @@ from imagebind.models import imagebind_model
 from imagebind.models.imagebind_model import ModalityType
 
 from app.settings import EmbeddingSettings, get_settings
-from utils.hashing import canonicalize_vector
+from utils.hashing import canonicalize_batch, canonicalize_vector
+
+
+logger = logging.getLogger(__name__)
+
+_IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp", ".heic"})
+
+
+@lru_cache(maxsize=32)
+def _is_image_suffix(suffix: str) -> bool:
+    # Libraries use a handful of distinct suffixes, so bulk ingest hits the
+    # cache instead of lowercasing every path.
+    return suffix.lower() in _IMAGE_SUFFIXES
 
 
 def _seed_everything(seed: int) -> None:
@@ -49,21 +64,61 @@ class ImageBindService:
         self.model = imagebind_model.imagebind_huge(pretrained=True)
         self.model.eval()
         self.model.to(self.device)
+        self._autocast = app_settings.half_precision and self.device.type == "cuda"
+        if app_settings.compile_model:
+            # Leave the process-wide deterministic flags alone; compiled kernels
+            # can still reorder float math, which changes the dedup hashes.
+            logger.warning(
+                "embedding.compile_model is enabled: vectors and their hashes "
+                "are not reproducible across runs or with uncompiled workers"
+            )
+            self.model = torch.compile(self.model, mode="reduce-overhead", fullgraph=False)
+        self._pinned: torch.Tensor | None = None
+        # Embed calls run in worker threads and share the one staging buffer.
+        self._pinned_lock = threading.Lock()
+
+    def _forward(self, inputs: dict, modality: str) -> torch.Tensor:
+        with torch.inference_mode(), torch.autocast(
+            "cuda", dtype=torch.float16, enabled=self._autocast
+        ):
+            return self.model(inputs)[modality]
+
+    def _to_host(self, embeddings: torch.Tensor) -> np.ndarray:
+        """Copy a ``(n, dim)`` batch to host memory with a single device sync."""
+        embeddings = embeddings.detach()
+        if embeddings.device.type != "cuda":
+            return embeddings.float().numpy()
+        rows, dim = embeddings.shape
+        with self._pinned_lock:
+            if self._pinned is None or self._pinned.shape[0] < rows or self._pinned.shape[1] != dim:
+                self._pinned = torch.empty((rows, dim), dtype=torch.float32, pin_memory=True)
+            staging = self._pinned[:rows]
+            staging.copy_(embeddings, non_blocking=True)
+            torch.cuda.current_stream(embeddings.device).synchronize()
+            # The staging buffer is reused by the next batch, so hand out a copy.
+            return staging.numpy().copy()
 
     def _canonicalize(self, tensor: torch.Tensor) -> EmbeddingResult:
         vec = tensor.detach().cpu().numpy().astype(np.float32)
         canonical_vec, vec_hash = canonicalize_vector(vec, round_eps=self.settings.round_eps)
         return EmbeddingResult(vector=canonical_vec, vector_hash=vec_hash)
 
+    def _canonicalize_batch(self, embeddings: torch.Tensor) -> list[EmbeddingResult]:
+        return [
+            EmbeddingResult(vector=vec, vector_hash=vec_hash)
+            for vec, vec_hash in canonicalize_batch(
+                self._to_host(embeddings), round_eps=self.settings.round_eps
+            )
+        ]
+
     def embed_text(self, texts: Sequence[str]) -> list[EmbeddingResult]:
         if not texts:
             return []
         inputs = {
             ModalityType.TEXT: data.load_and_transform_text(list(texts), self.device),
         }
-        with torch.no_grad():
-            embeddings = self.model(inputs)[ModalityType.TEXT]
-        return [self._canonicalize(vec) for vec in embeddings]
+        embeddings = self._forward(inputs, ModalityType.TEXT)
+        return self._canonicalize_batch(embeddings)
 
     def embed_images(self, image_paths: Sequence[Path]) -> list[EmbeddingResult]:
         paths = [str(Path(path)) for path in image_paths]
@@ -72,9 +127,8 @@ class ImageBindService:
         inputs = {
             ModalityType.VISION: data.load_and_transform_vision_data(paths, self.device),
         }
-        with torch.no_grad():
-            embeddings = self.model(inputs)[ModalityType.VISION]
-        return [self._canonicalize(vec) for vec in embeddings]
+        embeddings = self._forward(inputs, ModalityType.VISION)
+        return self._canonicalize_batch(embeddings)
 
     def embed_audio(self, audio_paths: Sequence[Path]) -> list[EmbeddingResult]:
         paths = [str(Path(path)) for path in audio_paths]
@@ -83,18 +137,16 @@ class ImageBindService:
         inputs = {
             ModalityType.AUDIO: data.load_and_transform_audio_data(paths, self.device),
         }
-        with torch.no_grad():
-            embeddings = self.model(inputs)[ModalityType.AUDIO]
-        return [self._canonicalize(vec) for vec in embeddings]
+        embeddings = self._forward(inputs, ModalityType.AUDIO)
+        return self._canonicalize_batch(embeddings)
 
     def embed_video(self, video_path: Path) -> EmbeddingResult:
         inputs = {
             ModalityType.VISION: data.load_and_transform_video_data([str(video_path)], self.device),
         }
-        with torch.no_grad():
-            embeddings = self.model(inputs)[ModalityType.VISION]
+        embeddings = self._forward(inputs, ModalityType.VISION)
         # Expect a single embedding returned for the clip
-        return self._canonicalize(embeddings[0])
+        return self._canonicalize_batch(embeddings[:1])[0]
 
     def embed_catalog(
         self,
@@ -114,8 +166,7 @@ class ImageBindService:
         return text_result
 
     def embed_personal_media(self, media_path: Path) -> EmbeddingResult:
-        suffix = media_path.suffix.lower()
-        if suffix in {".jpg", ".jpeg", ".png", ".webp", ".heic"}:
+        if _is_image_suffix(media_path.suffix):
             return self.embed_images([media_path])[0]
         return self.embed_video(media_path)
 
@@ -16,6 +16,7 @@ import torch
 from sentence_transformers import SentenceTransformer
 
 from app.settings import get_settings
+from utils.batching import EmbeddingBatcher
 from utils.hashing import canonicalize_vector
 
 logger = logging.getLogger(__name__)
@@ -117,6 +118,8 @@ class SentenceBertService:
                 f"Expected {self.EXPECTED_DIM} dimensions for {model_name}, "
                 f"got {self.embedding_dim}"
             )
+
+        self._batcher: EmbeddingBatcher[TextEmbeddingResult] = EmbeddingBatcher(self.encode_batch)
     
     def _canonicalize(self, vector: np.ndarray) -> TextEmbeddingResult:
         """Canonicalize vector: normalize, round, and hash.
@@ -143,6 +146,17 @@ class SentenceBertService:
         results = self.encode_batch([text])
         return results[0]
     
+    async def encode_async(self, text: str) -> TextEmbeddingResult:
+        """Encode ``text`` off the event loop, batched with concurrent callers.
+        
+        Args:
+            text: Text string to embed
+            
+        Returns:
+            TextEmbeddingResult with vector and hash
+        """
+        return await self._batcher.submit(text)
+    
     def encode_batch(
         self,
         texts: Sequence[str],
@@ -19,7 +19,7 @@ from infrastructure.embedding import get_sentence_bert_service, SentenceBertServ
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Result from text search containing media ID and similarity score."""
     media_id: str
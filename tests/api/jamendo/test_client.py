@@ -5,7 +5,7 @@ from pathlib import Path
 import httpx
 import pytest
 
-from api.catalog.jamendo.client import JamendoClient
+from api.catalog.jamendo.client import JamendoClient, _fast_year
 
 
 def test_search_tracks_returns_music_track_media(tmp_path):
@@ -64,6 +64,7 @@ def test_search_tracks_returns_music_track_media(tmp_path):
         assert track.album_id == "771"
         assert track.track_number == 2
         assert track.duration_s == 180
+        assert track.release_year == 2023
         assert track.genres == ["ambient", "lofi"]
         assert track.license.startswith("https://creativecommons.org/")
         assert track.audio_url.endswith("123.mp3")
@@ -131,3 +132,11 @@ def test_download_track_saves_file(tmp_path: Path, content: bytes):
         assert result.path == expected_path
 
     asyncio.run(runner())
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("2023-05-01", 2023), ("1999", 1999), ("20x3-01-01", None), ("2023/05/01", None), ("", None), (None, None)],
+)
+def test_fast_year(value, expected):
+    assert _fast_year(value) == expected
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 
+import msgspec
 import pytest
 
-from api.metadata.tmdb.client import TMDbClient
+from api.metadata.tmdb.client import TMDbAPIError, TMDbClient
 
 
 def test_search_movie_returns_movie_media(monkeypatch) -> None:
@@ -32,9 +33,9 @@ def test_search_movie_returns_movie_media(monkeypatch) -> None:
         ],
     }
 
-    async def fake_request(method: str, endpoint: str, params: dict[str, object]) -> dict[str, object]:
+    async def fake_request(method: str, endpoint: str, params: dict[str, object], *, decode_type=None):
         assert endpoint == "search/movie"
-        return sample_response
+        return msgspec.convert(sample_response, decode_type)
 
     monkeypatch.setattr(client, "_request", fake_request)
 
@@ -52,3 +53,165 @@ def test_search_movie_returns_movie_media(monkeypatch) -> None:
     assert movie.poster and movie.poster.file_path.endswith("/poster.jpg")
 
     asyncio.run(client.close())
+
+
+def test_movie_details_are_cached(monkeypatch) -> None:
+    client = TMDbClient(api_key="dummy")
+    calls: list[str] = []
+
+    async def fake_fetch(method: str, endpoint: str, params: dict[str, object]) -> bytes:
+        calls.append(endpoint)
+        await asyncio.sleep(0)
+        return b'{"id": 603, "title": "The Matrix", "release_date": "1999-03-31"}'
+
+    monkeypatch.setattr(client, "_fetch", fake_fetch)
+
+    async def runner() -> None:
+        first, second = await asyncio.gather(
+            client.get_movie_details(603),
+            client.get_movie_details(603),
+        )
+        third = await client.get_movie_details(603)
+        assert first.title == second.title == third.title == "The Matrix"
+        await client.get_movie_details(603, language="de-DE")
+        await client.close()
+
+    asyncio.run(runner())
+
+    assert calls == ["movie/603", "movie/603"]
+
+
+def test_movie_details_map_credits(monkeypatch) -> None:
+    client = TMDbClient(api_key="dummy")
+
+    async def fake_fetch(method: str, endpoint: str, params: dict[str, object]) -> bytes:
+        return (
+            b'{"id": 603, "title": "The Matrix", "videos": {"results": []},'
+            b' "credits": {"cast": [{"name": "Keanu Reeves", "character": "Neo"},'
+            b' {"name": ""}], "crew": []}}'
+        )
+
+    monkeypatch.setattr(client, "_fetch", fake_fetch)
+
+    movie = asyncio.run(client.get_movie_details(603, append_to_response=["credits"]))
+
+    assert movie.cast == ["Keanu Reeves"]
+    asyncio.run(client.close())
+
+
+def test_movie_details_many_bounds_concurrency(monkeypatch) -> None:
+    client = TMDbClient(api_key="dummy")
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch(method: str, endpoint: str, params: dict[str, object]) -> bytes:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        movie_id = endpoint.rsplit("/", 1)[1]
+        return b'{"id": %s, "title": "Movie %s"}' % (movie_id.encode(), movie_id.encode())
+
+    monkeypatch.setattr(client, "_fetch", fake_fetch)
+
+    movies = asyncio.run(client.get_movie_details_many(range(1, 9), concurrency=3))
+
+    assert [movie.catalog_id for movie in movies] == [str(i) for i in range(1, 9)]
+    assert peak == 3
+    asyncio.run(client.close())
+
+
+def test_cache_evicts_least_recently_used(monkeypatch) -> None:
+    client = TMDbClient(api_key="dummy")
+    monkeypatch.setattr(client, "CACHE_MAX_ENTRIES", 2)
+    loads: list[str] = []
+
+    def loader(key: str):
+        async def load() -> str:
+            loads.append(key)
+            return key
+
+        return load
+
+    async def failing_load() -> str:
+        raise TMDbAPIError(500, "boom")
+
+    async def runner() -> None:
+        await client._cached("a", loader("a"))
+        await client._cached("b", loader("b"))
+        await client._cached("a", loader("a"))
+        await client._cached("c", loader("c"))
+        assert await client._cached("a", loader("a")) == "a"
+        await client._cached("b", loader("b"))
+        with pytest.raises(TMDbAPIError):
+            await client._cached("d", failing_load)
+        await client.close()
+
+    asyncio.run(runner())
+
+    assert loads == ["a", "b", "c", "b"]
+    assert client._cache_locks == {}
+
+
+def test_movie_details_tolerate_null_fields(monkeypatch) -> None:
+    client = TMDbClient(api_key="dummy")
+
+    async def fake_fetch(method: str, endpoint: str, params: dict[str, object]) -> bytes:
+        return (
+            b'{"id": 603, "title": "The Matrix", "status": null, "budget": null,'
+            b' "original_language": null, "genres": [{"id": 28, "name": null}],'
+            b' "production_countries": [{"iso_3166_1": "US", "name": null}],'
+            b' "spoken_languages": [{"iso_639_1": null, "name": "English", "english_name": null}]}'
+        )
+
+    monkeypatch.setattr(client, "_fetch", fake_fetch)
+
+    movie = asyncio.run(client.get_movie_details(603))
+
+    assert movie.title == "The Matrix"
+    assert movie.genres == []
+    assert movie.languages == ["English"]
+    asyncio.run(client.close())
+
+
+def test_cache_lock_survives_an_earlier_generation(monkeypatch) -> None:
+    client = TMDbClient(api_key="dummy")
+    gates = {name: asyncio.Event() for name in ("a", "b", "c")}
+    loads: list[str] = []
+
+    def loader(name: str, fail: bool = False):
+        async def load() -> str:
+            loads.append(name)
+            await gates[name].wait()
+            if fail:
+                raise TMDbAPIError(500, "boom")
+            return name
+
+        return load
+
+    async def runner() -> None:
+        first = asyncio.create_task(client._cached("k", loader("a", fail=True)))
+        second = asyncio.create_task(client._cached("k", loader("b")))
+        await asyncio.sleep(0)
+        gates["a"].set()
+        with pytest.raises(TMDbAPIError):
+            await first
+        await asyncio.sleep(0)
+        # The failed load dropped the first lock, so a new caller starts a second one.
+        third = asyncio.create_task(client._cached("k", loader("c")))
+        await asyncio.sleep(0)
+        newer_lock = client._cache_locks["k"]
+
+        gates["b"].set()
+        assert await second == "b"
+        assert client._cache_locks.get("k") is newer_lock
+
+        gates["c"].set()
+        assert await third == "c"
+        assert client._cache_locks == {}
+        await client.close()
+
+    asyncio.run(runner())
+
+    assert loads == ["a", "b", "c"]
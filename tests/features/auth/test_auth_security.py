@@ -0,0 +1,59 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from app.settings import SecuritySettings
+from features.auth import security
+from features.auth.security import create_access_token, decode_access_token
+
+
+def test_decode_access_token_reuses_verified_payload(monkeypatch):
+    settings = SecuritySettings(secret_key="test-secret")
+    token = create_access_token("admin-1", settings)
+
+    assert decode_access_token(token, settings)["sub"] == "admin-1"
+
+    calls = []
+    original = jwt.decode
+    monkeypatch.setattr(
+        security.jwt, "decode", lambda *a, **kw: calls.append(1) or original(*a, **kw)
+    )
+    assert decode_access_token(token, settings)["sub"] == "admin-1"
+    assert calls == []
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_access_token(token, SecuritySettings(secret_key="other-secret"))
+
+
+def _cache_key(token: str, settings: SecuritySettings) -> tuple[bytes, str]:
+    return hashlib.sha256(token.encode()).digest(), settings.algorithm
+
+
+def test_decode_access_token_rejects_expired_cached_token():
+    settings = SecuritySettings(secret_key="test-secret")
+    expired = datetime.now(tz=timezone.utc) - timedelta(seconds=1)
+    token = jwt.encode({"sub": "admin-1", "exp": expired}, settings.secret_key)
+    # Bind the cache to this secret first so the seeded entry is not cleared.
+    decode_access_token(create_access_token("admin-2", settings), settings)
+    security._token_cache[_cache_key(token, settings)] = (
+        {"sub": "admin-1"},
+        expired.timestamp(),
+    )
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_access_token(token, settings)
+    assert _cache_key(token, settings) not in security._token_cache
+
+
+def test_token_cache_is_cleared_when_the_secret_changes():
+    settings = SecuritySettings(secret_key="test-secret")
+    token = create_access_token("admin-1", settings)
+    decode_access_token(token, settings)
+
+    assert _cache_key(token, settings) in security._token_cache
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_access_token(token, SecuritySettings(secret_key="rotated"))
+    assert security._token_cache == {}
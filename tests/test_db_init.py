@@ -0,0 +1,78 @@
+import asyncio
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from db.init import init_db
+from db.models import Admin, Participant
+
+
+def test_init_db_converts_legacy_auth_timestamps(tmp_path: Path):
+    db_path = tmp_path / "legacy.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE admins (admin_id VARCHAR(36) PRIMARY KEY, email VARCHAR(255) NOT NULL, "
+            "hashed_password VARCHAR(255) NOT NULL, display_name VARCHAR(255), "
+            "created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO admins VALUES ('a', 'a@example.com', 'x', NULL, "
+            "'2024-05-01 10:20:30.123456', '2024-05-01 10:20:30.123456')"
+        )
+
+    asyncio.run(_run_init(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        stored = conn.execute("SELECT created_at, typeof(created_at) FROM admins").fetchone()
+        participant = conn.execute("SELECT typeof(created_at) FROM participants").fetchone()
+    assert stored == (1714558830, "integer")
+    assert participant == ("integer",)
+
+
+async def _run_init(db_path: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    await init_db(engine)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as session:
+        admin = await session.scalar(select(Admin))
+        assert admin.created_at == datetime(2024, 5, 1, 10, 20, 30)
+
+        participant = Participant(participant_id="p", handle="owner", role="owner")
+        session.add(participant)
+        await session.commit()
+        assert isinstance(participant.created_at, datetime)
+    await engine.dispose()
+
+
+def test_init_db_converts_legacy_timestamps_once(tmp_path: Path):
+    db_path = tmp_path / "current.sqlite"
+    asyncio.run(_init_only(db_path))
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone() == (1,)
+        conn.execute(
+            "INSERT INTO admins VALUES ('a', 'a@example.com', 'x', NULL, "
+            "'2024-05-01 10:20:30', '2024-05-01 10:20:30')"
+        )
+
+    asyncio.run(_init_only(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT typeof(created_at) FROM admins").fetchone() == ("text",)
+
+
+def test_unix_now_renders_per_dialect():
+    from sqlalchemy.dialects import postgresql, sqlite
+
+    from db.types import unix_now
+
+    assert "strftime" in str(unix_now().compile(dialect=sqlite.dialect()))
+    assert "EXTRACT(EPOCH" in str(unix_now().compile(dialect=postgresql.dialect()))
+
+
+async def _init_only(db_path: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    await init_db(engine)
+    await engine.dispose()
@@ -0,0 +1,59 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from db import session as db_session
+from db.init import init_db
+from db.models import Participant
+
+
+def test_session_scope_commits_only_after_writes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    commits: list[int] = []
+    original_commit = AsyncSession.commit
+
+    async def counting_commit(self: AsyncSession) -> None:
+        commits.append(1)
+        await original_commit(self)
+
+    monkeypatch.setattr(AsyncSession, "commit", counting_commit)
+    asyncio.run(_run_scopes(tmp_path / "scope.sqlite", monkeypatch, commits))
+
+
+async def _run_scopes(db_path: Path, monkeypatch: pytest.MonkeyPatch, commits: list[int]) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    await init_db(engine)
+    monkeypatch.setitem(db_session.SessionLocal.kw, "bind", engine)
+
+    async with db_session.session_scope() as session:
+        assert await session.scalar(select(Participant)) is None
+        assert session.in_transaction()
+    assert commits == []
+
+    async with db_session.session_scope() as session:
+        session.add(Participant(participant_id="p", handle="owner", role="owner"))
+    assert len(commits) == 1
+
+    async with db_session.session_scope() as session:
+        await session.execute(update(Participant).values(role="viewer"))
+    assert len(commits) == 2
+
+    async with db_session.session_scope() as session:
+        assert await session.scalar(select(Participant.role)) == "viewer"
+    assert len(commits) == 2
+
+    async with db_session.session_scope() as session:
+        await session.execute(
+            text(
+                "INSERT INTO participants (participant_id, handle, role) "
+                "VALUES ('q', 'guest', 'viewer')"
+            )
+        )
+    assert len(commits) == 3
+
+    async with db_session.session_scope() as session:
+        guest = await session.scalar(select(Participant).where(Participant.participant_id == "q"))
+        assert guest is not None and guest.handle == "guest"
+    await engine.dispose()
@@ -0,0 +1,42 @@
+import asyncio
+
+from utils.batching import EmbeddingBatcher
+
+
+def test_concurrent_submits_share_one_batch():
+    calls: list[list[str]] = []
+
+    def encode_batch(texts):
+        calls.append(list(texts))
+        return [text.upper() for text in texts]
+
+    async def runner():
+        batcher = EmbeddingBatcher(encode_batch, max_batch=3, max_wait_s=0.01)
+        results = await asyncio.gather(*(batcher.submit(text) for text in "abcd"))
+        assert results == ["A", "B", "C", "D"]
+
+    asyncio.run(runner())
+
+    assert calls == [["a", "b", "c"], ["d"]]
+
+
+def test_batch_errors_reach_every_caller():
+    def encode_batch(texts):
+        raise RuntimeError("model failed")
+
+    async def runner():
+        batcher = EmbeddingBatcher(encode_batch, max_wait_s=0.01)
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    asyncio.run(runner())
+
+
+def test_single_submit_flushes_after_wait():
+    async def runner():
+        batcher = EmbeddingBatcher(lambda texts: [len(t) for t in texts], max_wait_s=0.01)
+        assert await asyncio.wait_for(batcher.submit("abc"), timeout=1) == 3
+
+    asyncio.run(runner())
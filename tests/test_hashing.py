@@ -0,0 +1,126 @@
+import math
+import os
+import threading
+
+import numpy as np
+from blake3 import blake3
+
+from utils.hashing import blake3_file, canonicalize_batch, canonicalize_vector
+
+
+def _reference(vector: np.ndarray, round_eps: float) -> tuple[np.ndarray, str]:
+    vec = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec = vec / norm
+    if round_eps > 0:
+        decimals = max(0, int(round(-math.log10(round_eps))))
+        vec = np.round(vec, decimals=decimals)
+    return vec, blake3(np.asarray(vec, dtype="<f4").tobytes()).hexdigest()
+
+
+def test_canonicalize_vector_matches_reference():
+    rng = np.random.default_rng(0)
+    for round_eps in (1e-6, 1e-3, 0.0):
+        for _ in range(20):
+            vector = rng.standard_normal(1024).astype(np.float32)
+            vec, vec_hash = canonicalize_vector(vector, round_eps=round_eps)
+            ref_vec, ref_hash = _reference(vector, round_eps)
+            assert vec.tobytes() == ref_vec.tobytes()
+            assert vec_hash == ref_hash
+
+
+def test_canonicalize_vector_leaves_input_untouched():
+    vector = np.zeros(8, dtype=np.float32)
+    vector[0] = 0.1234567
+    original = vector.copy()
+
+    canonicalize_vector(vector)
+
+    assert np.array_equal(vector, original)
+
+
+def test_blake3_file_matches_streamed_digest(tmp_path):
+    data = np.random.default_rng(0).bytes(3 << 20)
+    path = tmp_path / "media.bin"
+    path.write_bytes(data)
+    small = tmp_path / "small.bin"
+    small.write_bytes(data[:1000])
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+
+    assert blake3_file(path) == blake3(data).hexdigest()
+    assert blake3_file(small) == blake3(data[:1000]).hexdigest()
+    assert blake3_file(empty) == blake3(b"").hexdigest()
+
+
+def test_canonicalize_batch_matches_per_vector():
+    rng = np.random.default_rng(1)
+    vectors = list(rng.standard_normal((16, 1024)).astype(np.float32))
+    vectors[3] = np.zeros(1024, dtype=np.float32)
+
+    for round_eps in (1e-6, 0.0):
+        batch = canonicalize_batch(vectors, round_eps=round_eps)
+        single = [canonicalize_vector(vec, round_eps=round_eps) for vec in vectors]
+        assert [h for _, h in batch] == [h for _, h in single]
+        for (vec, _), (ref, _) in zip(batch, single):
+            assert vec.tobytes() == ref.tobytes()
+
+    assert canonicalize_batch([]) == []
+
+
+def test_canonicalize_handles_nan_rows_like_reference():
+    vector = np.array([0.5, np.nan, 0.25], dtype=np.float32)
+
+    vec, vec_hash = canonicalize_vector(vector)
+    ref_vec, ref_hash = _reference(vector, 1e-6)
+    (batch_vec, batch_hash), = canonicalize_batch([vector])
+
+    assert vec.tobytes() == ref_vec.tobytes() == batch_vec.tobytes()
+    assert vec_hash == ref_hash == batch_hash
+
+
+def test_blake3_file_streams_special_files(tmp_path):
+    data = np.random.default_rng(2).bytes((4 << 20) + 123)
+    fifo = tmp_path / "stream.fifo"
+    os.mkfifo(fifo)
+    writer = threading.Thread(target=fifo.write_bytes, args=(data,))
+    writer.start()
+
+    assert blake3_file(fifo) == blake3(data).hexdigest()
+    writer.join()
+
+
+def test_canonicalize_batch_parallel_matches_serial(monkeypatch):
+    from utils import hashing
+
+    vectors = list(np.random.default_rng(3).standard_normal((50, 64)).astype(np.float32))
+    serial = canonicalize_batch(vectors)
+
+    monkeypatch.setattr(hashing, "PARALLEL_BATCH_ROWS", 8)
+    monkeypatch.setattr(hashing, "_WORKERS", 4)
+    monkeypatch.setattr(hashing, "_pool", None)
+    parallel = canonicalize_batch(vectors)
+
+    assert [h for _, h in parallel] == [h for _, h in serial]
+    assert all(a.tobytes() == b.tobytes() for (a, _), (b, _) in zip(parallel, serial))
+
+
+def test_batch_pool_is_created_once_under_contention(monkeypatch):
+    from utils import hashing
+
+    monkeypatch.setattr(hashing, "_pool", None)
+    barrier = threading.Barrier(8)
+    pools = []
+
+    def first_call():
+        barrier.wait()
+        pools.append(hashing._batch_pool())
+
+    threads = [threading.Thread(target=first_call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(pool) for pool in pools}) == 1
@@ -0,0 +1,60 @@
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.responses import AppJSONResponse, FileRangeResponse
+from domain.media.base import ImageMetadata
+
+
+def _client(path: Path, start: int, end: int) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/file")
+    async def serve() -> FileRangeResponse:
+        return FileRangeResponse(
+            path,
+            start,
+            end,
+            media_type="application/octet-stream",
+            headers={"Content-Length": str(end - start + 1)},
+        )
+
+    return TestClient(app)
+
+
+def test_file_range_response_streams_requested_bytes(monkeypatch, tmp_path: Path):
+    path = tmp_path / "media.bin"
+    payload = bytes(range(256)) * 20_000
+    path.write_bytes(payload)
+    monkeypatch.setattr(FileRangeResponse, "chunk_size", 4096)
+
+    response = _client(path, 10, 9_999).get("/file")
+    whole = _client(path, 0, len(payload) - 1).get("/file")
+
+    assert response.status_code == 200
+    assert response.content == payload[10:10_000]
+    assert response.headers["content-length"] == "9990"
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert whole.content == payload
+
+
+def test_app_json_response_renders_models_and_numpy():
+    body = AppJSONResponse(
+        {
+            "poster": ImageMetadata(file_path="/p.jpg"),
+            "scores": np.array([0.5, 0.25], dtype=np.float32),
+            "at": datetime(2024, 5, 1, 10, 20, 30),
+            1: "non-str key",
+        }
+    ).body
+
+    assert orjson.loads(body) == {
+        "poster": {"file_path": "/p.jpg", "width": None, "height": None, "aspect_ratio": None},
+        "scores": [0.5, 0.25],
+        "at": "2024-05-01T10:20:30",
+        "1": "non-str key",
+    }
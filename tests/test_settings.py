@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from app.settings import get_settings
+
+
+def _configure(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("BITHARBOR_SERVER__DATA_ROOT", str(tmp_path / "data"))
+    monkeypatch.setenv("BITHARBOR_ANN__INDEX_DIRECTORY", str(tmp_path / "index"))
+    monkeypatch.setenv("BITHARBOR_ANN__VECTORS_PATH", str(tmp_path / "vectors.fp32"))
+    monkeypatch.delenv("BITHARBOR_SECURITY__SECRET_KEY", raising=False)
+
+
+def test_generated_secret_key_is_shared(monkeypatch, tmp_path: Path):
+    _configure(monkeypatch, tmp_path)
+
+    get_settings.cache_clear()
+    first = get_settings().security.secret_key
+    get_settings.cache_clear()
+    second = get_settings().security.secret_key
+
+    assert first
+    assert first == second
+    assert (tmp_path / "data" / "secret_key").read_text() == first
+    get_settings.cache_clear()
+
+
+def test_secret_key_from_environment(monkeypatch, tmp_path: Path):
+    _configure(monkeypatch, tmp_path)
+    monkeypatch.setenv("BITHARBOR_SECURITY__SECRET_KEY", "configured")
+
+    get_settings.cache_clear()
+    assert get_settings().security.secret_key == "configured"
+    assert not (tmp_path / "data" / "secret_key").exists()
+    get_settings.cache_clear()
+
+
+def test_generated_secret_key_is_owner_only(monkeypatch, tmp_path: Path):
+    _configure(monkeypatch, tmp_path)
+
+    get_settings.cache_clear()
+    get_settings()
+
+    key_path = tmp_path / "data" / "secret_key"
+    assert key_path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in key_path.parent.iterdir() if p.name.startswith(".")] == []
+    get_settings.cache_clear()
+
+
+def test_empty_secret_key_file_is_rejected(monkeypatch, tmp_path: Path):
+    _configure(monkeypatch, tmp_path)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "secret_key").write_text("\n")
+
+    get_settings.cache_clear()
+    with pytest.raises(RuntimeError, match="empty"):
+        get_settings()
+    get_settings.cache_clear()
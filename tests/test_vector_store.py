@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from infrastructure.ann.kernels import cosine_scores
+from infrastructure.ann.vector_store import QuantizedVectorStore, VectorStore
+
+
+def _reference_top_k(vectors: np.ndarray, query: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    normalised = vectors / np.where(norms == 0.0, 1.0, norms)
+    sims = normalised @ (query / np.linalg.norm(query))
+    order = np.argsort(sims)[::-1][:k]
+    return order, sims[order]
+
+
+def test_read_rows_tracks_appends(tmp_path) -> None:
+    store = VectorStore(tmp_path / "vectors.fp32", dim=4)
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((6, 4)).astype(np.float32)
+
+    for i, vec in enumerate(vectors[:3]):
+        assert store.append(vec) == i
+    np.testing.assert_array_equal(store.read_rows([2, 0]), vectors[[2, 0]])
+
+    for vec in vectors[3:]:
+        store.append(vec)
+    np.testing.assert_array_equal(store.read_rows([5, 1, 4]), vectors[[5, 1, 4]])
+    np.testing.assert_array_equal(store.read_all(), vectors)
+
+
+def test_search_cosine_matches_reference(tmp_path) -> None:
+    store = VectorStore(tmp_path / "vectors.fp32", dim=8)
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((50, 8)).astype(np.float32)
+    vectors[7] = 0.0
+    for vec in vectors:
+        store.append(vec)
+    query = rng.standard_normal(8).astype(np.float32)
+
+    ids, scores = store.search_cosine(query, 5)
+    expected_ids, expected_scores = _reference_top_k(vectors, query, 5)
+
+    np.testing.assert_array_equal(ids, expected_ids)
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-5, atol=1e-6)
+    assert ids.dtype == np.int64 and scores.dtype == np.float32
+
+
+def test_search_cosine_edge_cases(tmp_path) -> None:
+    store = VectorStore(tmp_path / "vectors.fp32", dim=3)
+    query = np.ones(3, dtype=np.float32)
+    assert store.search_cosine(query, 3)[0].size == 0
+
+    store.append(np.array([1.0, 0.0, 0.0], dtype=np.float32))
+    store.append(np.array([0.0, 1.0, 0.0], dtype=np.float32))
+    assert store.search_cosine(query, 0)[0].size == 0
+    assert store.search_cosine(np.zeros(3, dtype=np.float32), 2)[0].size == 0
+
+    ids, _ = store.search_cosine(query, 10)
+    assert sorted(ids.tolist()) == [0, 1]
+
+
+def test_int8_store_round_trips_and_searches(tmp_path) -> None:
+    store = QuantizedVectorStore(tmp_path / "vectors.i8", dim=16)
+    rng = np.random.default_rng(2)
+    vectors = rng.standard_normal((40, 16)).astype(np.float32)
+    for vec in vectors:
+        store.append(vec)
+
+    assert store.path.stat().st_size == 40 * (16 + 8)
+
+    restored = store.read_rows([3, 17])
+    assert restored.dtype == np.float32
+    peak = np.abs(vectors[[3, 17]]).max(axis=1, keepdims=True)
+    assert np.all(np.abs(restored - vectors[[3, 17]]) <= peak / 127.0)
+
+    query = rng.standard_normal(16).astype(np.float32)
+    ids, scores = store.search_cosine(query, 3)
+    expected_ids, expected_scores = _reference_top_k(vectors, query, 3)
+    assert ids[0] == expected_ids[0]
+    np.testing.assert_allclose(scores, expected_scores, atol=2e-2)
+
+
+def test_cosine_scores_matches_reference() -> None:
+    rng = np.random.default_rng(3)
+    vectors = rng.standard_normal((10, 16)).astype(np.float32)
+    vectors[4] = 0.0
+    q = rng.standard_normal(16).astype(np.float32)
+    q /= np.linalg.norm(q)
+
+    out = np.empty(10, dtype=np.float32)
+    cosine_scores(vectors, q, out)
+
+    norms = np.linalg.norm(vectors, axis=1)
+    norms[norms == 0.0] = 1.0
+    np.testing.assert_allclose(out, (vectors @ q) / norms, rtol=1e-5, atol=1e-6)
+
+
+def test_append_many_matches_single_appends(tmp_path) -> None:
+    rng = np.random.default_rng(4)
+    vectors = rng.standard_normal((5, 8)).astype(np.float32)
+
+    for store_cls, name in ((VectorStore, "vectors.fp32"), (QuantizedVectorStore, "vectors.i8")):
+        single = store_cls(tmp_path / "single" / name, dim=8)
+        batched = store_cls(tmp_path / "batched" / name, dim=8)
+        for vec in vectors:
+            single.append(vec)
+        batched.append(vectors[0])
+
+        assert batched.append_many(vectors[1:]) == range(1, 5)
+        assert batched.path.read_bytes() == single.path.read_bytes()
+        np.testing.assert_array_equal(batched.read_all(), single.read_all())
+
+
+def test_read_rows_rejects_missing_rows(tmp_path) -> None:
+    store = VectorStore(tmp_path / "vectors.fp32", dim=4)
+    store.append(np.ones(4, dtype=np.float32))
+
+    assert store.read_rows([]).shape == (0, 4)
+    with pytest.raises(IndexError):
+        store.read_rows([0, 1])
+
+
+def test_read_all_is_a_read_only_view(tmp_path) -> None:
+    store = VectorStore(tmp_path / "vectors.fp32", dim=4)
+    store.append(np.arange(4, dtype=np.float32))
+
+    view = store.read_all()
+    assert not view.flags.writeable
+
+    copy = store.copy_all()
+    copy[0, 0] = 42.0
+    np.testing.assert_array_equal(store.read_all()[0], np.arange(4, dtype=np.float32))
+
+
+def test_refresh_picks_up_rows_from_other_writers(tmp_path) -> None:
+    path = tmp_path / "vectors.fp32"
+    reader = VectorStore(path, dim=4)
+    writer = VectorStore(path, dim=4)
+    writer.append(np.ones(4, dtype=np.float32))
+
+    assert reader.row_count() == 0
+    reader.refresh()
+    assert reader.row_count() == 1
+    assert reader.append(np.zeros(4, dtype=np.float32)) == 1
+    assert writer.append(np.zeros(4, dtype=np.float32)) == 2
+
+
+def test_scan_l2_matches_reference(tmp_path) -> None:
+    rng = np.random.default_rng(5)
+    vectors = rng.standard_normal((20, 8)).astype(np.float32)
+    query = rng.standard_normal(8).astype(np.float32)
+    expected = ((vectors - query) ** 2).sum(axis=1)
+
+    store = VectorStore(tmp_path / "vectors.fp32", dim=8)
+    assert store.scan_l2(query).shape == (0,)
+    store.append_many(vectors)
+    np.testing.assert_allclose(store.scan_l2(query), expected, rtol=1e-4, atol=1e-4)
+
+    quantized = QuantizedVectorStore(tmp_path / "vectors.i8", dim=8)
+    quantized.append_many(vectors)
+    np.testing.assert_allclose(quantized.scan_l2(query), expected, rtol=5e-2, atol=5e-2)
+
+
+def test_scan_topk_matches_full_scan(tmp_path) -> None:
+    rng = np.random.default_rng(6)
+    vectors = rng.standard_normal((37, 8)).astype(np.float32)
+    query = rng.standard_normal(8).astype(np.float32)
+    store = VectorStore(tmp_path / "vectors.fp32", dim=8)
+    assert store.scan_topk(query, 3)[0].size == 0
+    store.append_many(vectors)
+
+    expected = np.argsort(store.scan_l2(query))[:5]
+    ids, dists = store.scan_topk(query, 5, block=8)
+
+    np.testing.assert_array_equal(ids, expected)
+    assert np.all(np.diff(dists) >= 0)
+    assert store.scan_topk(query, 100, block=8)[0].shape == (37,)
+
+
+def test_quantized_store_tracks_fp32_reference(tmp_path) -> None:
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((200, 32)).astype(np.float32)
+    reference = VectorStore(tmp_path / "vectors.fp32", dim=32)
+    quantized = QuantizedVectorStore(tmp_path / "vectors.i8", dim=32)
+    reference.append_many(vectors)
+    quantized.append_many(vectors)
+
+    for query in rng.standard_normal((5, 32)).astype(np.float32):
+        expected, _ = reference.search_cosine(query, 10)
+        ids, _ = quantized.search_cosine(query, 10)
+        assert len(set(ids.tolist()) & set(expected.tolist())) >= 8
+
+    with pytest.raises(IndexError):
+        quantized.read_rows([200])
+
+
+def test_bypass_page_cache_appends_are_readable(tmp_path) -> None:
+    vectors = np.arange(24, dtype=np.float32).reshape(3, 8)
+    store = VectorStore(tmp_path / "vectors.fp32", dim=8, bypass_page_cache=True)
+
+    assert store.append_many(vectors) == range(0, 3)
+    np.testing.assert_array_equal(store.read_rows([2, 0]), vectors[[2, 0]])
+
+
+def test_search_sees_rows_appended_by_another_store(tmp_path) -> None:
+    path = tmp_path / "vectors.fp32"
+    reader = VectorStore(path, dim=3)
+    writer = VectorStore(path, dim=3)
+    assert reader.search_cosine(np.ones(3, dtype=np.float32), 1)[0].size == 0
+
+    writer.append(np.array([1.0, 0.0, 0.0], dtype=np.float32))
+    writer.append(np.array([0.0, 1.0, 0.0], dtype=np.float32))
+
+    ids, _ = reader.search_cosine(np.array([0.0, 1.0, 0.0], dtype=np.float32), 2)
+    assert ids.tolist() == [1, 0]
+    assert reader.read_all().shape == (2, 3)
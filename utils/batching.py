@@ -0,0 +1,61 @@
+"""Coalesce concurrent single-item embedding requests into batched calls."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Generic, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class EmbeddingBatcher(Generic[T]):
+    """Collect ``submit`` calls for up to ``max_wait_s`` and encode them together.
+
+    Model forward passes cost roughly the same up to a few dozen inputs, so
+    ingest requests that arrive close together share a single call to
+    ``encode_batch``. The batch runs in a worker thread, keeping the event loop
+    free while the model works.
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[Sequence[str]], Sequence[T]],
+        *,
+        max_batch: int = 32,
+        max_wait_s: float = 0.05,
+    ) -> None:
+        self._encode_batch = encode_batch
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_s
+        self._pending: list[tuple[str, asyncio.Future[T]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def submit(self, text: str) -> T:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_s, self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.create_task(self._run(batch))
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[T]]]) -> None:
+        try:
+            results = await asyncio.to_thread(self._encode_batch, [text for text, _ in batch])
+        except Exception as exc:  # noqa: BLE001 - surfaced to every waiter
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -1,18 +1,38 @@
 from __future__ import annotations
 
 import math
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Tuple
 
 import numpy as np
 from blake3 import blake3
 
+# Below this size thread fan-out and mmap setup cost more than they save.
+MMAP_HASH_MIN_BYTES = 1 << 20
 
-def blake3_file(path: Path, chunk_size: int = 1 << 20) -> str:
+
+def blake3_file(path: Path, chunk_size: int = 4 << 20) -> str:
+    """Hash a file, memory-mapping large regular files so blake3 can use every core."""
+    st = os.stat(path)
+    if stat.S_ISREG(st.st_mode):
+        if st.st_size < MMAP_HASH_MIN_BYTES:
+            return blake3(path.read_bytes()).hexdigest()
+        threads = blake3.AUTO if (os.cpu_count() or 1) > 1 else 1
+        try:
+            return blake3(max_threads=threads).update_mmap(path).hexdigest()
+        except OSError:
+            pass
     hasher = blake3()
-    with path.open("rb") as infile:
-        for chunk in iter(lambda: infile.read(chunk_size), b""):
-            hasher.update(chunk)
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    with path.open("rb", buffering=0) as infile:
+        while size := infile.readinto(buf):
+            hasher.update(view[:size])
     return hasher.hexdigest()
 
 
@@ -21,26 +41,105 @@ def blake3_string(text: str) -> str:
     return blake3(text.encode("utf-8")).hexdigest()
 
 
+# Below this many rows the pool hand-off costs more than the rows themselves.
+PARALLEL_BATCH_ROWS = 1024
+
+_WORKERS = os.cpu_count() or 1
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=16)
+def _round_scale(round_eps: float) -> np.float32:
+    """``10**decimals`` for ``round_eps``; the setting is fixed, so compute it once."""
+    return np.float32(10.0 ** max(0, int(round(-math.log10(round_eps)))))
+
+
+def _normalize_round(vec: np.ndarray, norm: np.float32, scale: np.float32) -> None:
+    """``vec / norm`` then ``np.round`` in place, with the same float32 steps.
+
+    ``np.round(x, d)`` is ``rint(x * 10**d) / 10**d``; spelling the ufuncs out
+    skips its Python-level dispatch.
+    """
+    np.divide(vec, norm, out=vec)
+    np.multiply(vec, scale, out=vec)
+    np.rint(vec, out=vec)
+    np.divide(vec, scale, out=vec)
+
+
+def _normalize_round_rows(matrix: np.ndarray, norms: np.ndarray, scale: np.float32) -> None:
+    """Row-wise ``_normalize_round`` over the whole matrix in four ufunc passes."""
+    np.divide(matrix, norms[:, None], out=matrix)
+    np.multiply(matrix, scale, out=matrix)
+    np.rint(matrix, out=matrix)
+    np.divide(matrix, scale, out=matrix)
+
+
 def canonicalize_vector(
     vector: np.ndarray,
     round_eps: float = 1e-6,
 ) -> tuple[np.ndarray, str]:
-    vec = np.asarray(vector, dtype=np.float32)
+    # Copy once up front; everything after works in place on ``vec``.
+    vec = np.array(vector, dtype="<f4", order="C")
     norm = np.linalg.norm(vec)
-    if norm > 0:
-        vec = vec / norm
-
     if round_eps > 0:
-        decimals = max(0, int(round(-math.log10(round_eps))))
-        vec = np.round(vec, decimals=decimals, out=vec)
+        # Dividing by one is exact, so zero vectors are only rounded.
+        _normalize_round(vec, norm if norm > 0 else np.float32(1.0), _round_scale(round_eps))
+    elif norm > 0:
+        np.divide(vec, norm, out=vec)
 
-    byte_view = np.asarray(vec, dtype="<f4", order="C").tobytes()
-    vector_hash = blake3(byte_view).hexdigest()
+    # ``vec`` is a fresh little-endian C-contiguous copy, so hash its buffer in place.
+    vector_hash = blake3(vec.view(np.uint8)).hexdigest()
     return vec, vector_hash
 
 
 def canonicalize_batch(
     vectors: Iterable[np.ndarray], round_eps: float = 1e-6
 ) -> list[tuple[np.ndarray, str]]:
-    return [canonicalize_vector(vec, round_eps=round_eps) for vec in vectors]
+    """``canonicalize_vector`` over many rows, normalizing and rounding as one matrix.
+
+    Row norms still come from ``np.linalg.norm`` per row: a 2-D reduction sums in
+    a different order and would change the hashes used for deduplication.
+    """
+    rows = [np.asarray(vec, dtype=np.float32) for vec in vectors]
+    if not rows:
+        return []
+    if rows[0].ndim != 1 or any(row.shape != rows[0].shape for row in rows):
+        return [canonicalize_vector(row, round_eps=round_eps) for row in rows]
+
+    matrix = np.array(rows, dtype="<f4", order="C")
+    if len(rows) < PARALLEL_BATCH_ROWS or _WORKERS < 2:
+        hashes = _canonicalize_rows(matrix, round_eps)
+    else:
+        blocks = np.array_split(matrix, _WORKERS)
+        hashes = [
+            vec_hash
+            for block_hashes in _batch_pool().map(
+                _canonicalize_rows, blocks, [round_eps] * len(blocks)
+            )
+            for vec_hash in block_hashes
+        ]
+    return list(zip(matrix, hashes))
+
+
+def _canonicalize_rows(matrix: np.ndarray, round_eps: float) -> list[str]:
+    """Canonicalize ``matrix`` rows in place and return their hashes."""
+    norms = np.array([np.linalg.norm(row) for row in matrix], dtype=np.float32)
+    # Dividing by one is exact, so zero (and NaN) rows skip normalization.
+    norms[~(norms > 0)] = 1.0
+    if round_eps > 0:
+        _normalize_round_rows(matrix, norms, _round_scale(round_eps))
+    else:
+        np.divide(matrix, norms[:, None], out=matrix)
+    row_bytes = matrix.view(np.uint8)
+    return [blake3(row).hexdigest() for row in row_bytes]
+
 
+def _batch_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        # First calls can race from several executor threads; build one pool.
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=_WORKERS, thread_name_prefix="canonicalize")
+    return _pool